@@ -21,7 +21,7 @@ class VehicleInfo:
     proximity_sensor_range: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PassiveSensors:
     """Passive sensors snapshot available to the bot each frame.
 
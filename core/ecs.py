@@ -22,6 +22,10 @@ class Entity:
         """Add a component instance to the entity."""
         self.components[type(component)] = component
 
+    def add_components(self, *components: Any) -> None:
+        """Add several component instances in one dict update."""
+        self.components.update((type(component), component) for component in components)
+
     def get_component(self, component_type: Type[T]) -> T | None:
         """Get a component instance by type."""
         return self.components.get(component_type)
@@ -70,11 +74,10 @@ class World:
 
     def get_entities_with(self, *component_types: Type) -> list[Entity]:
         """Return all entities that have ALL of the specified component types."""
-        result = []
-        for entity in self.entities:
-            if all(entity.has_component(ct) for ct in component_types):
-                result.append(entity)
-        return result
+        # Subset test on the component dict's key view runs in C; every system
+        # issues this query each frame against the full entity list.
+        required = frozenset(component_types)
+        return [entity for entity in self.entities if entity.components.keys() >= required]
 
     def update(self, dt: float) -> None:
         """Update all systems."""
@@ -3,9 +3,13 @@ from __future__ import annotations
 import csv
 import hashlib
 import json
+import sys
 from pathlib import Path
 from typing import Any
 
+_CSV_WRITE_BUFFER = 1 << 20
+_COUNTED_STATES = ("landed", "crashed", "out_of_fuel", "flying")
+
 
 def normalize_run_result(
     *,
@@ -15,7 +19,8 @@ def normalize_run_result(
     seed: int | None,
     result: dict[str, Any],
 ) -> dict[str, Any]:
-    state = str(result.get("state", "unknown"))
+    # Interned so the per-record state comparisons in aggregation hit the identity fast path.
+    state = sys.intern(str(result.get("state", "unknown")))
     landing_count = int(result.get("landing_count", 0) or 0)
     crash_count = int(result.get("crash_count", 0) or 0)
     record = {
@@ -42,19 +47,14 @@ def normalize_run_result(
 
 def aggregate_eval_records(records: list[dict[str, Any]]) -> dict[str, Any]:
     total = len(records)
-    landed = sum(1 for r in records if r.get("state") == "landed")
-    crashes = sum(1 for r in records if r.get("state") == "crashed")
-    out_of_fuel = sum(1 for r in records if r.get("state") == "out_of_fuel")
-    flying = sum(1 for r in records if r.get("state") == "flying")
-    other = total - landed - crashes - out_of_fuel - flying
-    success_rate = (landed / total) if total > 0 else 0.0
-
+    totals = dict.fromkeys(_COUNTED_STATES, 0)
     by_scenario: dict[str, dict[str, Any]] = {}
+    # Single pass: overall and per-scenario counts are tallied together.
     for record in records:
         key = str(record.get("scenario") or "default")
-        item = by_scenario.setdefault(
-            key,
-            {
+        item = by_scenario.get(key)
+        if item is None:
+            item = by_scenario[key] = {
                 "runs": 0,
                 "landed": 0,
                 "crashed": 0,
@@ -62,11 +62,11 @@ def aggregate_eval_records(records: list[dict[str, Any]]) -> dict[str, Any]:
                 "flying": 0,
                 "other": 0,
                 "success_rate": 0.0,
-            },
-        )
+            }
         item["runs"] += 1
         state = record.get("state")
-        if state in ("landed", "crashed", "out_of_fuel", "flying"):
+        if state in totals:
+            totals[state] += 1
             item[state] += 1
         else:
             item["other"] += 1
@@ -75,14 +75,15 @@ def aggregate_eval_records(records: list[dict[str, Any]]) -> dict[str, Any]:
         runs = int(item["runs"])
         item["success_rate"] = (item["landed"] / runs) if runs > 0 else 0.0
 
+    landed = totals["landed"]
     return {
         "runs": total,
         "landed": landed,
-        "crashed": crashes,
-        "out_of_fuel": out_of_fuel,
-        "flying": flying,
-        "other": other,
-        "success_rate": success_rate,
+        "crashed": totals["crashed"],
+        "out_of_fuel": totals["out_of_fuel"],
+        "flying": totals["flying"],
+        "other": total - sum(totals.values()),
+        "success_rate": (landed / total) if total > 0 else 0.0,
         "by_scenario": by_scenario,
     }
 
@@ -140,10 +141,12 @@ def write_csv_records(path: str | Path, records: list[dict[str, Any]]) -> Path:
     for record in records:
         fieldnames_set.update(record.keys())
     fieldnames = sorted(fieldnames_set)
-    with out.open("w", newline="", encoding="utf-8") as fh:
-        writer = csv.DictWriter(fh, fieldnames=fieldnames)
-        writer.writeheader()
-        for record in records:
-            writer.writerow(record)
+    # Project records onto the header as tuples and write them in one pass;
+    # same output as DictWriter (missing keys -> "") minus its per-row key checks.
+    rows = [tuple(record.get(name, "") for name in fieldnames) for record in records]
+    with out.open("w", newline="", encoding="utf-8", buffering=_CSV_WRITE_BUFFER) as fh:
+        writer = csv.writer(fh)
+        writer.writerow(fieldnames)
+        writer.writerows(rows)
     return out
 
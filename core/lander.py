@@ -30,17 +30,19 @@ class Lander(Entity):
         spawn_pos = Vector2(start_pos) if start_pos is not None else Vector2(100.0, 0.0)
         self.start_pos = Vector2(spawn_pos)
 
-        self.add_component(Transform(pos=Vector2(spawn_pos)))
-        self.add_component(PhysicsState())
-        self.add_component(FuelTank())
-        self.add_component(Engine())
-        self.add_component(LanderGeometry())
-        self.add_component(Radar())
-        self.add_component(LanderState())
-        self.add_component(Wallet())
-        self.add_component(ActorProfile(kind="lander"))
-        self.add_component(ActorControlRole(role="none"))
-        self.add_component(PlayerSelectable())
-        self.add_component(ControlIntent())
-        self.add_component(RefuelConfig())
-        self.add_component(SensorReadings())
+        self.add_components(
+            Transform(pos=Vector2(spawn_pos)),
+            PhysicsState(),
+            FuelTank(),
+            Engine(),
+            LanderGeometry(),
+            Radar(),
+            LanderState(),
+            Wallet(),
+            ActorProfile(kind="lander"),
+            ActorControlRole(role="none"),
+            PlayerSelectable(),
+            ControlIntent(),
+            RefuelConfig(),
+            SensorReadings(),
+        )
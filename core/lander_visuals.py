@@ -9,13 +9,24 @@ from core.maths import RigidTransform2, Vector2
 
 @dataclass
 class Thrust:
-    """Thrust flame descriptor for rendering."""
+    """Thrust flame descriptor for rendering.
+
+    ``ux``/``uy`` is the unit flame direction; producers that already know the
+    orientation pass it in, otherwise it is derived from ``angle``.
+    """
     x: float
     y: float
     angle: float
     width: float
     length: float
     power: float
+    ux: float | None = None
+    uy: float | None = None
+
+    def __post_init__(self) -> None:
+        if self.ux is None or self.uy is None:
+            self.ux = math.cos(self.angle)
+            self.uy = math.sin(self.angle)
 
 
 class LanderVisuals:
@@ -82,5 +93,8 @@ class LanderVisuals:
                 width=self.width / 2.0,
                 length=20.0,
                 power=self.thrust_level,
+                # (cos, sin) of world_angle, without the round trip through trig
+                ux=-sin_r,
+                uy=-cos_r,
             )
         ]
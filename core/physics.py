@@ -57,6 +57,8 @@ class PhysicsEngine:
 
         # Terrain window state
         self._terrain_shapes: list[pm.Shape] = []
+        self._terrain_by_index: dict[int, pm.Shape] = {}
+        self._dirty_terrain_cells: set[int] = set()
         self._landing_site_shapes: list[pm.Shape] = []
         self._window_center_x: float | None = None
 
@@ -350,6 +352,21 @@ class PhysicsEngine:
             self.space.add(seg)
             self._landing_site_shapes.append(seg)
 
+    def invalidate_terrain(self, x_min: float, x_max: float) -> None:
+        """Mark terrain cells overlapping ``[x_min, x_max]`` for re-sampling.
+
+        Call this when the height sampler changes under an existing window (e.g.
+        a flush landing site spawns). The cells are rebuilt on the next step, so
+        the sampler only needs to reflect the change by then.
+        """
+        step = self.segment_step
+        # Cell i spans [i * step, (i + 1) * step]; include cells that merely touch the span.
+        first = math.ceil(x_min / step) - 1
+        last = math.floor(x_max / step) + 1
+        self._dirty_terrain_cells.update(
+            i for i in range(first, last) if i in self._terrain_by_index
+        )
+
     # ----- Internal helpers -----
 
     def _ensure_window_centered(self, center_x: float) -> None:
@@ -359,31 +376,58 @@ class PhysicsEngine:
         shift = abs(center_x - self._window_center_x)
         if shift >= (0.25 * self.half_width):
             self._rebuild_window(center_x)
+        elif self._dirty_terrain_cells:
+            self._rebuild_window(self._window_center_x)
 
     def _rebuild_window(self, center_x: float) -> None:
-        # Remove old terrain shapes
-        if self._terrain_shapes:
-            self.space.remove(*self._terrain_shapes)
-            self._terrain_shapes.clear()
+        """Cover ``center_x +/- half_width`` with terrain segments on the step grid.
 
+        Segments are keyed by grid index, so a re-centre only removes the cells
+        that left the window and creates the ones that entered it; the overlap
+        (most of the window, since re-centring happens every quarter width) is
+        kept as-is instead of being rebuilt. Cells flagged by
+        :meth:`invalidate_terrain` are always re-sampled.
+        """
         step = self.segment_step
-        start_x = math.floor((center_x - self.half_width) / step) * step
-        end_x = math.ceil((center_x + self.half_width) / step) * step
-
-        prev_x = start_x
-        prev_y = float(self.height_sampler(prev_x))
-        x = start_x + step
-        while x <= end_x + 1e-6:
-            y = float(self.height_sampler(x))
-            seg = pm.Segment(self.space.static_body, (prev_x, prev_y), (x, y), 1.0)
-            seg.friction = 0.8
-            seg.elasticity = 0.0
-            seg.collision_type = self._COLL_TERRAIN
-            self.space.add(seg)
-            self._terrain_shapes.append(seg)
-            prev_x, prev_y = x, y
-            x += step
-
+        first = math.floor((center_x - self.half_width) / step)
+        last = math.ceil((center_x + self.half_width) / step)
+
+        old = self._terrain_by_index
+        dirty = self._dirty_terrain_cells
+        if dirty:
+            old = {i: seg for i, seg in old.items() if i not in dirty}
+            self.space.remove(*(self._terrain_by_index[i] for i in dirty))
+            dirty.clear()
+        stale = [seg for i, seg in old.items() if not first <= i < last]
+        if stale:
+            self.space.remove(*stale)
+
+        sampler = self.height_sampler
+        static_body = self.space.static_body
+        coll_terrain = self._COLL_TERRAIN
+        window: dict[int, pm.Shape] = {}
+        added: list[pm.Shape] = []
+        prev_i: int | None = None
+        prev_y = 0.0
+        for i in range(first, last):
+            seg = old.get(i)
+            if seg is None:
+                x0 = i * step
+                y0 = prev_y if prev_i == i else float(sampler(x0))
+                x1 = (i + 1) * step
+                y1 = float(sampler(x1))
+                seg = pm.Segment(static_body, (x0, y0), (x1, y1), 1.0)
+                seg.friction = 0.8
+                seg.elasticity = 0.0
+                seg.collision_type = coll_terrain
+                added.append(seg)
+                prev_i, prev_y = i + 1, y1
+            window[i] = seg
+        if added:
+            self.space.add(*added)
+
+        self._terrain_by_index = window
+        self._terrain_shapes = list(window.values())
         self._window_center_x = center_x
 
     # ----- Collision callbacks -----
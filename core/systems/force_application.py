@@ -1,5 +1,5 @@
 import math
-from core.ecs import System, Entity
+from core.ecs import System
 from core.components import Engine, Transform
 from core.maths import Vector2
 
@@ -16,14 +16,14 @@ class ForceApplicationSystem(System):
             return
 
         for entity in self.world.get_entities_with(Engine, Transform):
-            self._apply_forces(entity)
-            self._apply_rotation_override(entity)
+            # Fetch components once and share them between the force and override pushes.
+            engine = entity.get_component(Engine)
+            trans = entity.get_component(Transform)
+            self._apply_forces(entity.uid, engine, trans)
+            self._apply_rotation_override(entity.uid, trans)
 
-    def _apply_forces(self, entity: Entity) -> None:
+    def _apply_forces(self, uid: str, engine: Engine, trans: Transform) -> None:
         """Calculate and apply engine thrust force to the physics body."""
-        engine = entity.get_component(Engine)
-        trans = entity.get_component(Transform)
-
         if engine.thrust_level <= 0.0:
             return
 
@@ -32,16 +32,15 @@ class ForceApplicationSystem(System):
         fy = math.cos(trans.rotation) * thrust
         force = Vector2(fx, fy)
         if hasattr(self.engine_adapter, "apply_force_for"):
-            self.engine_adapter.apply_force_for(entity.uid, force)
+            self.engine_adapter.apply_force_for(uid, force)
         else:
             self.engine_adapter.apply_force(force)
 
-    def _apply_rotation_override(self, entity: Entity) -> None:
+    def _apply_rotation_override(self, uid: str, trans: Transform) -> None:
         """Push current rotation to the physics body (kinematic override)."""
-        trans = entity.get_component(Transform)
         # Rotation is kinematically driven by PropulsionSystem; we tell the
         # physics engine the current angle so the collision shape stays in sync.
         if hasattr(self.engine_adapter, "override_for"):
-            self.engine_adapter.override_for(entity.uid, trans.rotation)
+            self.engine_adapter.override_for(uid, trans.rotation)
         else:
             self.engine_adapter.override(trans.rotation)
@@ -2,6 +2,15 @@ import math
 from core.ecs import System, Entity
 from core.components import Engine, FuelTank, LanderState, Transform
 
+_TWO_PI = 2.0 * math.pi
+# Rotation eases in proportionally once within this band of the target angle.
+_EASE_BAND = math.radians(15.0)
+
+
+def _angle_diff(a: float, b: float) -> float:
+    return (b - a + math.pi) % _TWO_PI - math.pi
+
+
 class PropulsionSystem(System):
     """Handles thrust and rotation mechanics based on Engine state."""
 
@@ -44,22 +53,18 @@ class PropulsionSystem(System):
             engine.thrust_level = max(0.0, engine.thrust_level - min(step, -delta_thrust))
 
         # 2. Rotation Slew
-        def _angle_diff(a: float, b: float) -> float:
-            d = (b - a + math.pi) % (2 * math.pi) - math.pi
-            return d
-
         d_ang = _angle_diff(trans.rotation, engine.target_angle)
+        abs_d_ang = abs(d_ang)
         max_step = engine.max_rotation_rate * dt
-        ease_band = math.radians(15.0)
-        
+
         # Simple proportional control inside ease band
         step_mag = (
             max_step
-            if abs(d_ang) >= ease_band
-            else max_step * (abs(d_ang) / max(ease_band, 1e-6))
+            if abs_d_ang >= _EASE_BAND
+            else max_step * (abs_d_ang / _EASE_BAND)
         )
 
-        if abs(d_ang) <= step_mag:
+        if abs_d_ang <= step_mag:
             trans.rotation = engine.target_angle
         else:
             trans.rotation += math.copysign(step_mag, d_ang)
@@ -31,14 +31,15 @@ def _anchored_profile(
     step = max(1e-6, float(step))
     min_x = min(x0, x1)
     max_x = max(x0, x1)
-    start_x = math.floor(min_x / step) * step
-    end_x = math.ceil(max_x / step) * step
+    # Index the grid instead of accumulating ``step``: a fixed sample count, and the
+    # same world x for a grid cell regardless of where the span starts.
+    first = math.floor(min_x / step)
+    last = math.ceil(max_x / step)
 
     out: list[tuple[float, float]] = []
-    xx = start_x
-    while xx <= end_x + 1e-9:
+    for i in range(first, last + 1):
+        xx = i * step
         out.append((xx, _sample_height(height_func, xx, lod=lod)))
-        xx += step
     return out
 
 
@@ -6,6 +6,7 @@ Controls:
   - Q / ESC: Quit
 """
 
+import math
 import sys
 import pygame
 
@@ -71,14 +72,12 @@ class LevelViewer:
         self.target_segments = 60  # desired number of segments across screen
 
     def _lod_for_zoom(self) -> int:
+        # One LOD per halving of zoom below 1.0 (1 -> 0, 0.5 -> 1, 0.25 -> 2), capped at 3.
+        # frexp gives z = m * 2**e with 0.5 <= m < 1, so [2**-k, 2**(1-k)) has e == 1 - k.
         z = self.camera.zoom
-        if z >= 1.0:
-            return 0
-        if z >= 0.5:
-            return 1
-        if z >= 0.25:
-            return 2
-        return 3
+        if z <= 0.0:
+            return 3
+        return min(3, max(0, 1 - math.frexp(z)[1]))
 
     def handle_events(self) -> bool:
         for event in pygame.event.get():
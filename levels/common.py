@@ -315,11 +315,15 @@ class PresetLevel(Level):
         self.world.site_entities.append(site_entity)
         game.ecs_world.add_entity(site_entity)
 
+        engine = getattr(self, "engine", None)
         if (not terrain_bound) or terrain_mode == "elevated_supports":
             self._dynamic_elevated_sites.append((x, y, size))
-            engine = getattr(self, "engine", None)
             if engine is not None:
                 engine.set_landing_site_colliders(self._dynamic_elevated_sites)
+        elif engine is not None:
+            # Flush sites reshape the sampled terrain; drop any cached physics cells under them.
+            half_span = size / 2.0 + blend_margin
+            engine.invalidate_terrain(x - half_span, x + half_span)
 
     def setup(self, _game, seed: int) -> None:
         rng = random.Random(seed)
@@ -382,10 +386,12 @@ class PresetLevel(Level):
 
         lander_name = getattr(self, "lander_name", "classic")
         player_lander = create_lander(lander_name)
-        player_lander.add_component(ActorProfile(kind="lander", name="player"))
-        player_lander.add_component(ActorControlRole(role="human"))
-        player_lander.add_component(PlayerSelectable(order=0))
-        player_lander.add_component(PlayerControlled(active=True))
+        player_lander.add_components(
+            ActorProfile(kind="lander", name="player"),
+            ActorControlRole(role="human"),
+            PlayerSelectable(order=0),
+            PlayerControlled(active=True),
+        )
         player_trans = _require_component(player_lander, Transform)
         player_geo = _require_component(player_lander, LanderGeometry)
         player_radar = _require_component(player_lander, Radar)
@@ -161,10 +161,12 @@ class ScenarioLevel(Level):
 
         lander_name = getattr(self, "lander_name", "classic")
         lander = create_lander(lander_name)
-        lander.add_component(ActorProfile(kind="lander", name="player"))
-        lander.add_component(ActorControlRole(role="human"))
-        lander.add_component(PlayerSelectable(order=0))
-        lander.add_component(PlayerControlled(active=True))
+        lander.add_components(
+            ActorProfile(kind="lander", name="player"),
+            ActorControlRole(role="human"),
+            PlayerSelectable(order=0),
+            PlayerControlled(active=True),
+        )
 
         trans = _require_component(lander, Transform)
         geo = _require_component(lander, LanderGeometry)
@@ -3,9 +3,16 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import os
-from concurrent.futures import ProcessPoolExecutor, as_completed
-from dataclasses import dataclass
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any
 
 from core.eval import (
@@ -16,12 +23,12 @@ from core.eval import (
     write_json_report,
 )
 from game import LanderGame
-from bots import create_bot, list_available_bots
-from levels import create_level, list_available_levels
+from bots import list_available_bots, load_bot_class
+from levels import list_available_levels, load_level_class
 from landers import list_available_landers
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RunConfig:
     level_name: str
     bot_name: str | None
@@ -42,6 +49,12 @@ class RunConfig:
     batch_csv: str | None
     quick_benchmark: bool
     batch_workers: int
+    batch_backend: str = "process"
+    # Derived once from the batch options above; see __post_init__.
+    is_batch: bool = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "is_batch", _wants_batch(self))
 
 
 def _format_list(title: str, items: list[str]) -> str:
@@ -164,19 +177,20 @@ def _build_parser() -> argparse.ArgumentParser:
         default=1,
         help="Batch worker processes (1 = sequential)",
     )
+    parser.add_argument(
+        "--batch-backend",
+        choices=("process", "thread"),
+        default="process",
+        help=(
+            "Batch worker pool: 'process' (default) or 'thread' (no spawn/pickling;\n"
+            "only faster when runs spend their time outside the GIL; not with --plot)"
+        ),
+    )
     return parser
 
 
 def _parse_args(args: argparse.Namespace) -> RunConfig:
-    batch_mode = bool(
-        args.batch
-        or args.quick_benchmark
-        or args.batch_seeds is not None
-        or args.batch_levels is not None
-        or args.batch_json is not None
-        or args.batch_csv is not None
-    )
-    print_freq = (0 if batch_mode else 60) if args.freq is None else args.freq
+    print_freq = (0 if _wants_batch(args) else 60) if args.freq is None else args.freq
     max_time = 300.0 if args.time is None else args.time
     plot_mode = "none" if args.plot is None else args.plot
 
@@ -200,58 +214,63 @@ def _parse_args(args: argparse.Namespace) -> RunConfig:
         batch_csv=args.batch_csv,
         quick_benchmark=args.quick_benchmark,
         batch_workers=max(1, int(args.batch_workers)),
+        batch_backend=args.batch_backend,
     )
 
 
 def _announce_config(config: RunConfig, args: argparse.Namespace) -> None:
+    lines: list[str] = []
     if config.headless:
-        print("Running in headless mode")
+        lines.append("Running in headless mode")
 
     if args.freq is not None:
         if config.print_freq == 0:
-            print("Stats output disabled")
+            lines.append("Stats output disabled")
         elif config.print_freq == 1:
-            print("Printing stats every frame")
+            lines.append("Printing stats every frame")
         else:
-            print(
+            lines.append(
                 f"Printing stats every {config.print_freq} frames ({config.print_freq / 60:.2f}s)"
             )
-    elif _is_batch_mode(config):
-        print("Stats output disabled (batch default)")
+    elif config.is_batch:
+        lines.append("Stats output disabled (batch default)")
 
     if args.time is not None:
-        print(f"Max time: {config.max_time}s (headless mode)")
+        lines.append(f"Max time: {config.max_time}s (headless mode)")
 
     if args.plot is not None:
-        print(f"Plot mode: {config.plot_mode}")
+        lines.append(f"Plot mode: {config.plot_mode}")
 
     if config.stop_on_crash:
-        print("Stop on crash: enabled")
+        lines.append("Stop on crash: enabled")
     if config.stop_on_out_of_fuel:
-        print("Stop on out-of-fuel: enabled")
+        lines.append("Stop on out-of-fuel: enabled")
     if config.stop_on_first_land:
-        print("Stop on first land: enabled")
+        lines.append("Stop on first land: enabled")
 
     if config.seed is not None:
-        print(f"Using seed: {config.seed}")
+        lines.append(f"Using seed: {config.seed}")
 
     if config.lander_name:
-        print(f"Using lander: {config.lander_name}")
-    if _is_batch_mode(config):
-        print("Batch mode: enabled")
-        print(f"Batch workers requested: {config.batch_workers}")
+        lines.append(f"Using lander: {config.lander_name}")
+    if config.is_batch:
+        lines.append("Batch mode: enabled")
+        lines.append(f"Batch workers requested: {config.batch_workers}")
+        if config.batch_backend != "process":
+            lines.append(f"Batch backend: {config.batch_backend}")
         if config.batch_seeds:
-            print(f"Batch seeds: {config.batch_seeds}")
+            lines.append(f"Batch seeds: {config.batch_seeds}")
         if config.batch_levels:
-            print(f"Batch levels: {config.batch_levels}")
+            lines.append(f"Batch levels: {config.batch_levels}")
         if config.quick_benchmark:
-            print("Quick benchmark preset: enabled")
+            lines.append("Quick benchmark preset: enabled")
+
+    if lines:
+        print("\n".join(lines))
 
 
 def _print_headless_results(result: dict) -> None:
-    print("\n" + "=" * 60)
-    print("FINAL RESULTS")
-    print("=" * 60)
+    lines: list[str] = ["\n" + "=" * 60, "FINAL RESULTS", "=" * 60]
     for key in (
         "time",
         "state",
@@ -264,53 +283,49 @@ def _print_headless_results(result: dict) -> None:
         if key in result:
             val = result[key]
             if isinstance(val, float):
-                print(f"{key.capitalize():<18}{val:.2f}")
+                lines.append(f"{key.capitalize():<18}{val:.2f}")
             else:
-                print(f"{key.capitalize():<18}{val}")
-    print("=" * 60)
+                lines.append(f"{key.capitalize():<18}{val}")
+    lines.append("=" * 60)
     if result.get("plot_paths"):
-        print("Plots:")
+        lines.append("Plots:")
         for p in result["plot_paths"]:
-            print(f"  {p}")
+            lines.append(f"  {p}")
     elif result.get("plot_path"):
-        print(f"Plot:              {result['plot_path']}")
+        lines.append(f"Plot:              {result['plot_path']}")
     if result.get("plot_error"):
-        print(f"Plot error:        {result['plot_error']}")
+        lines.append(f"Plot error:        {result['plot_error']}")
+
+    print("\n".join(lines))
 
 
-def _is_batch_mode(config: RunConfig) -> bool:
+def _wants_batch(opts: argparse.Namespace | RunConfig) -> bool:
+    """Return True when any batch option is set (argparse args or RunConfig)."""
     return bool(
-        config.batch
-        or config.quick_benchmark
-        or config.batch_seeds is not None
-        or config.batch_levels is not None
-        or config.batch_json is not None
-        or config.batch_csv is not None
+        opts.batch
+        or opts.quick_benchmark
+        or opts.batch_seeds is not None
+        or opts.batch_levels is not None
+        or opts.batch_json is not None
+        or opts.batch_csv is not None
     )
 
 
 def _parse_seed_spec(spec: str) -> list[int]:
-    values: list[int] = []
+    # A dict keeps insertion order, so it deduplicates in the same single pass.
+    seen: dict[int, None] = {}
     for token in (p.strip() for p in spec.split(",")):
         if not token:
             continue
-        if "-" in token:
-            left, right = token.split("-", 1)
-            start = int(left.strip())
-            end = int(right.strip())
+        left, sep, right = token.partition("-")
+        if sep:
+            start = int(left)
+            end = int(right)
             step = 1 if end >= start else -1
-            values.extend(range(start, end + step, step))
+            seen.update(dict.fromkeys(range(start, end + step, step)))
         else:
-            values.append(int(token))
-    # preserve insertion order while deduplicating
-    out: list[int] = []
-    seen: set[int] = set()
-    for value in values:
-        if value in seen:
-            continue
-        seen.add(value)
-        out.append(value)
-    return out
+            seen[int(token)] = None
+    return list(seen)
 
 
 def _parse_name_csv(spec: str) -> list[str]:
@@ -327,9 +342,16 @@ def _list_wave1_levels() -> list[str]:
     return [name for name in preferred if name in available]
 
 
+# Class discovery imports the module and probes its factory, so batch workers
+# resolve each level/bot name once and only pay for instantiation per run.
+# Instances stay per-run: level.setup() and bots carry seed-specific state.
+_cached_level_class = functools.lru_cache(maxsize=None)(load_level_class)
+_cached_bot_class = functools.lru_cache(maxsize=None)(load_bot_class)
+
+
 def _resolve_level_default_bot(level_name: str) -> str | None:
     try:
-        level = create_level(level_name)
+        level = _cached_level_class(level_name)()
     except Exception:
         return None
     default_bot = getattr(level, "default_bot_name", None)
@@ -388,18 +410,17 @@ def _configure_level(level, config: RunConfig) -> None:
         setattr(level, "lander_name", config.lander_name)
 
 
-def _run_once(
+def _run_once_for_batch(
     config: RunConfig,
     *,
-    seed: int | None = None,
-    level_name: str | None = None,
-    print_results: bool = True,
+    seed: int | None,
+    level_name: str,
 ) -> dict[str, Any]:
-    run_level_name = level_name or config.level_name
-    level = create_level(run_level_name)
+    """Build and run one game, returning the raw level result plus run labels."""
+    level = _cached_level_class(level_name)()
     _configure_level(level, config)
     run_bot_name = _resolve_run_bot_name(config, level)
-    bot = create_bot(run_bot_name) if run_bot_name is not None else None
+    bot = _cached_bot_class(run_bot_name)() if run_bot_name is not None else None
     game = LanderGame(seed=seed, bot=bot, headless=config.headless, level=level)
     result = game.run(
         print_freq=config.print_freq,
@@ -408,8 +429,23 @@ def _run_once(
     )
     if run_bot_name is not None:
         result["_bot_name"] = run_bot_name
-    result["_level_name"] = run_level_name
-    result["_scenario_name"] = getattr(level, "scenario_name", run_level_name)
+    result["_level_name"] = level_name
+    result["_scenario_name"] = getattr(level, "scenario_name", level_name)
+    return result
+
+
+def _run_once(
+    config: RunConfig,
+    *,
+    seed: int | None = None,
+    level_name: str | None = None,
+    print_results: bool = True,
+) -> dict[str, Any]:
+    result = _run_once_for_batch(
+        config,
+        seed=seed,
+        level_name=level_name or config.level_name,
+    )
     if config.headless and print_results:
         _print_headless_results(result)
     return result
@@ -421,19 +457,14 @@ def _run_once_record(
     seed: int | None,
     level_name: str,
 ) -> dict[str, Any]:
-    result = _run_once(
-        config,
-        seed=seed,
-        level_name=level_name,
-        print_results=False,
-    )
-    record_bot_name = str(result.get("_bot_name") or config.bot_name or "none")
-    record_level_name = str(result.get("_level_name") or level_name)
-    record_scenario_name = str(result.get("_scenario_name") or record_level_name)
+    result = _run_once_for_batch(config, seed=seed, level_name=level_name)
+    # _run_once_for_batch always stamps _level_name/_scenario_name and only
+    # stamps _bot_name when a bot (explicit or level default) was resolved.
+    record_level_name: str = result["_level_name"]
     return normalize_run_result(
-        bot_name=record_bot_name,
+        bot_name=result.get("_bot_name", "none"),
         level_name=record_level_name,
-        scenario=record_scenario_name,
+        scenario=result["_scenario_name"] or record_level_name,
         seed=seed,
         result=result,
     )
@@ -451,48 +482,166 @@ def _run_batch_sequential(
     return records
 
 
+def _run_chunk(
+    config: RunConfig,
+    pairs: list[tuple[int, str]],
+) -> list[dict[str, Any]]:
+    return [
+        _run_once_record(config, seed=seed, level_name=level_name)
+        for seed, level_name in pairs
+    ]
+
+
+# Set once per worker process by the pool initializer so chunk tasks only carry
+# their (seed, level) pairs across the pipe.
+_WORKER_CONFIG: RunConfig | None = None
+
+
+def _init_worker(config: RunConfig) -> None:
+    global _WORKER_CONFIG
+    _WORKER_CONFIG = config
+
+
+def _run_worker_chunk(pairs: list[tuple[int, str]]) -> list[dict[str, Any]]:
+    if _WORKER_CONFIG is None:
+        raise RuntimeError("Batch worker was not initialized with a RunConfig")
+    return _run_chunk(_WORKER_CONFIG, pairs)
+
+
+def _usable_cpus() -> int:
+    # Respect CPU affinity / cgroup pinning (containers, CI, SLURM) where available;
+    # os.cpu_count() reports every host core.
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return os.cpu_count() or 1
+
+
+def _chunk_run_plan(
+    run_plan: list[tuple[int, str]],
+    worker_count: int,
+) -> list[list[tuple[int, str]]]:
+    # ~4 chunks per worker keeps the pool balanced while amortizing IPC per task.
+    chunk_size = max(1, len(run_plan) // (worker_count * 4))
+    return [run_plan[i : i + chunk_size] for i in range(0, len(run_plan), chunk_size)]
+
+
+def _run_batch_parallel(
+    config: RunConfig,
+    run_plan: list[tuple[int, str]],
+    worker_count: int,
+) -> list[dict[str, Any]]:
+    total = len(run_plan)
+    chunks = _chunk_run_plan(run_plan, worker_count)
+    chunk_records: dict[int, list[dict[str, Any]]] = {}
+    pool: Executor
+    if config.batch_backend == "thread":
+        # Threads share the parent's config directly: no worker spawn, no pickling.
+        pool = ThreadPoolExecutor(max_workers=worker_count)
+        task, task_args = _run_chunk, (config,)
+    else:
+        pool = ProcessPoolExecutor(
+            max_workers=worker_count,
+            initializer=_init_worker,
+            initargs=(config,),
+        )
+        task, task_args = _run_worker_chunk, ()
+    with pool:
+        future_map = {
+            pool.submit(task, *task_args, chunk): chunk_idx
+            for chunk_idx, chunk in enumerate(chunks)
+        }
+        done = 0
+        for fut in as_completed(future_map):
+            chunk_idx = future_map[fut]
+            chunk = chunks[chunk_idx]
+            try:
+                records = fut.result()
+            except Exception as exc:
+                seed, level_name = chunk[0]
+                raise RuntimeError(
+                    f"chunk {chunk_idx + 1}/{len(chunks)} ({len(chunk)} runs from "
+                    f"seed={seed} level={level_name}) failed ({type(exc).__name__}: {exc})"
+                ) from exc
+            progress: list[str] = []
+            for seed, level_name in chunk:
+                done += 1
+                progress.append(f"[{done}/{total}] done seed={seed} level={level_name}")
+            print("\n".join(progress))
+            chunk_records[chunk_idx] = records
+    return [record for idx in range(len(chunks)) for record in chunk_records[idx]]
+
+
 def _print_batch_summary(
     summary: dict[str, Any],
     failures: list[dict[str, Any]],
     json_path,
     csv_path,
 ) -> None:
-    print("\n" + "=" * 60)
-    print("BATCH RESULTS")
-    print("=" * 60)
-    print(f"Runs:              {summary['runs']}")
-    print(f"Landed:            {summary['landed']}")
-    print(f"Crashed:           {summary['crashed']}")
-    print(f"Out_of_fuel:       {summary['out_of_fuel']}")
-    print(f"Flying:            {summary['flying']}")
-    print(f"Other:             {summary['other']}")
-    print(f"Success rate:      {summary['success_rate']:.2%}")
+    lines: list[str] = [
+        "\n" + "=" * 60,
+        "BATCH RESULTS",
+        "=" * 60,
+        f"Runs:              {summary['runs']}",
+        f"Landed:            {summary['landed']}",
+        f"Crashed:           {summary['crashed']}",
+        f"Out_of_fuel:       {summary['out_of_fuel']}",
+        f"Flying:            {summary['flying']}",
+        f"Other:             {summary['other']}",
+        f"Success rate:      {summary['success_rate']:.2%}",
+    ]
     if summary.get("by_scenario"):
-        print("\nPer-scenario:")
+        lines.append("\nPer-scenario:")
         for name in sorted(summary["by_scenario"]):
             row = summary["by_scenario"][name]
-            print(
+            lines.append(
                 f"  - {name}: runs={row['runs']} landed={row['landed']} "
                 f"crashed={row['crashed']} success={row['success_rate']:.2%}"
             )
     if failures:
-        print("\nFail samples:")
+        lines.append("\nFail samples:")
         for row in failures[:8]:
-            print(
+            lines.append(
                 f"  - seed={row.get('seed')} scenario={row.get('scenario') or 'default'} "
                 f"state={row.get('state')}"
             )
     if json_path is not None:
-        print(f"\nJSON report:       {json_path}")
+        lines.append(f"\nJSON report:       {json_path}")
     if csv_path is not None:
-        print(f"CSV report:        {csv_path}")
-    print("=" * 60)
+        lines.append(f"CSV report:        {csv_path}")
+    lines.append("=" * 60)
+
+    print("\n".join(lines))
+
+
+def _resolve_artifact_target(
+    spec: str | None,
+    *,
+    kind: str,
+    config: RunConfig,
+    bot_name: str,
+    seeds: list[int],
+    levels: list[str],
+) -> str | Path | None:
+    if not spec:
+        return None
+    if spec != "auto":
+        return spec
+    return default_artifact_path(
+        kind=kind,
+        level_name=config.level_name,
+        bot_name=bot_name,
+        seeds=seeds,
+        scenarios=levels,
+    )
 
 
 def _run_batch(config: RunConfig) -> int:
     batch_bot_name = config.bot_name or "level_default"
     if not config.headless:
         raise ValueError("Batch mode requires --headless")
+    if config.batch_backend == "thread" and config.plot_mode != "none":
+        # Plots go through pyplot's global figure state, which is not thread-safe.
+        raise ValueError("--plot requires --batch-backend=process")
 
     seeds, levels = _resolve_batch_plan(config)
     if not seeds:
@@ -515,38 +664,32 @@ def _run_batch(config: RunConfig) -> int:
                 f"{missing_csv}"
             )
 
-    worker_count = max(1, min(config.batch_workers, total, os.cpu_count() or 1))
+    # Artifact targets depend only on the plan, so resolve them before any run starts.
+    json_target = _resolve_artifact_target(
+        config.batch_json,
+        kind="json",
+        config=config,
+        bot_name=batch_bot_name,
+        seeds=seeds,
+        levels=levels,
+    )
+    csv_target = _resolve_artifact_target(
+        config.batch_csv,
+        kind="csv",
+        config=config,
+        bot_name=batch_bot_name,
+        seeds=seeds,
+        levels=levels,
+    )
+
+    worker_count = max(1, min(config.batch_workers, total, _usable_cpus()))
     print(f"Batch workers: requested={config.batch_workers} effective={worker_count}")
 
     if worker_count <= 1:
         records = _run_batch_sequential(config, run_plan)
     else:
-        indexed_records: dict[int, dict[str, Any]] = {}
         try:
-            with ProcessPoolExecutor(max_workers=worker_count) as pool:
-                future_map = {}
-                for run_idx, (seed, level_name) in enumerate(run_plan, start=1):
-                    fut = pool.submit(
-                        _run_once_record,
-                        config,
-                        seed=seed,
-                        level_name=level_name,
-                    )
-                    future_map[fut] = (run_idx, seed, level_name)
-                done = 0
-                for fut in as_completed(future_map):
-                    run_idx, seed, level_name = future_map[fut]
-                    try:
-                        record = fut.result()
-                    except Exception as exc:
-                        raise RuntimeError(
-                            f"run {run_idx}/{total} seed={seed} level={level_name} "
-                            f"failed ({type(exc).__name__}: {exc})"
-                        ) from exc
-                    done += 1
-                    print(f"[{done}/{total}] done seed={seed} level={level_name}")
-                    indexed_records[run_idx] = record
-            records = [indexed_records[i] for i in range(1, total + 1)]
+            records = _run_batch_parallel(config, run_plan, worker_count)
         except Exception as exc:
             print(
                 f"Batch workers unavailable ({type(exc).__name__}: {exc}); "
@@ -559,18 +702,7 @@ def _run_batch(config: RunConfig) -> int:
 
     json_path = None
     csv_path = None
-    if config.batch_json:
-        json_target = (
-            default_artifact_path(
-                kind="json",
-                level_name=config.level_name,
-                bot_name=batch_bot_name,
-                seeds=seeds,
-                scenarios=levels,
-            )
-            if config.batch_json == "auto"
-            else config.batch_json
-        )
+    if json_target is not None:
         json_path = write_json_report(
             json_target,
             {
@@ -578,18 +710,7 @@ def _run_batch(config: RunConfig) -> int:
                 "records": records,
             },
         )
-    if config.batch_csv:
-        csv_target = (
-            default_artifact_path(
-                kind="csv",
-                level_name=config.level_name,
-                bot_name=batch_bot_name,
-                seeds=seeds,
-                scenarios=levels,
-            )
-            if config.batch_csv == "auto"
-            else config.batch_csv
-        )
+    if csv_target is not None:
         csv_path = write_csv_records(csv_target, records)
 
     _print_batch_summary(summary, failed, json_path, csv_path)
@@ -607,7 +728,7 @@ def main() -> None:
     default_bot_name = _resolve_level_default_bot(config.level_name)
     if config.headless and not (config.bot_name or default_bot_name):
         parser.error("Headless mode requires a bot name or a level default bot")
-    if _is_batch_mode(config):
+    if config.is_batch:
         try:
             exit_code = _run_batch(config)
             raise SystemExit(exit_code)
@@ -0,0 +1,14 @@
+"""Small terrain stand-ins shared by the test modules."""
+
+from __future__ import annotations
+
+
+class FlatTerrain:
+    __slots__ = ()
+
+    def __call__(self, _x: float, lod: int = 0) -> float:
+        _ = lod
+        return 0.0
+
+    def get_resolution(self, _lod: int) -> float:
+        return 1.0
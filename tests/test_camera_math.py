@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
 import core.maths as maths
 from core.maths import Range1D, RigidTransform2, Size2, Vector2
-from ui.camera import Camera
+from ui.camera import Camera, OffsetCamera
 
 
 def test_math_transform_symbol_removed() -> None:
@@ -37,6 +38,44 @@ def test_camera_world_to_screen_requires_vector2() -> None:
         cam.world_to_screen(0.0, 0.0)  # type: ignore[call-arg]
 
 
+def test_offset_camera_batch_matches_scalar_mapping() -> None:
+    cam = OffsetCamera(10.0, -5.0, 0.37, 400.0, 120.0)
+    xs = [-1234.5, -10.0, 0.0, 9.99, 10.0, 777.25]
+    ys = [-300.0, 42.0, -5.0, 0.1, 1234.0, -0.5]
+
+    sx, sy = cam.world_to_screen_batch(xs, ys)
+
+    for x, y, bx, by in zip(xs, ys, sx, sy):
+        pt = cam.world_to_screen(Vector2(x, y))
+        assert (bx, by) == (pt.x, pt.y)
+
+
+def test_camera_batch_matches_scalar_mapping() -> None:
+    cam = Camera(640, 360)
+    cam.x = -12.5
+    cam.y = 40.0
+    cam.zoom = 0.3
+    xs = [-900.0, -12.5, 0.0, 33.3, 1500.0]
+    ys = [-50.0, 40.0, 0.0, 7.25, 600.0]
+
+    sx, sy = cam.world_to_screen_batch(xs, ys)
+
+    for x, y, bx, by in zip(xs, ys, sx, sy):
+        pt = cam.world_to_screen(Vector2(x, y))
+        assert (bx, by) == (pt.x, pt.y)
+
+    pts = np.column_stack((xs, ys))
+    assert cam.world_to_screen_inplace(pts) is pts
+    assert pts[:, 0].tolist() == sx.tolist()
+    assert pts[:, 1].tolist() == sy.tolist()
+
+    scale, tx, ty = cam.affine()
+    for x, y in zip(xs, ys):
+        pt = cam.world_to_screen(Vector2(x, y))
+        assert x * scale + tx == pytest.approx(pt.x)
+        assert ty - y * scale == pytest.approx(pt.y)
+
+
 def test_rigid_transform2_requires_vector2() -> None:
     tf = RigidTransform2(Vector2(1.0, 2.0), 0.0)
     out = tf.apply(Vector2(3.0, 4.0))
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import argparse
+import dataclasses
 
 import main as main_module
 import pytest
 from bots import create_bot, list_available_bots
-from core.eval import aggregate_eval_records, normalize_run_result
+from core.eval import aggregate_eval_records, normalize_run_result, write_csv_records
 from core.bot import Bot, BotAction
 from core.components import (
     ActorControlRole,
@@ -22,14 +23,45 @@ from core.landing_sites import LandingSiteSurfaceModel
 from core.maths import Vector2
 from core.lander import Lander
 from core.level import Level, LevelWorld
+from fakes import FlatTerrain
 from game import LanderGame, _build_headless_stats
-from main import RunConfig, _parse_args, _parse_seed_spec, _resolve_batch_plan, _run_batch
+from main import (
+    RunConfig,
+    _chunk_run_plan,
+    _parse_args,
+    _parse_seed_spec,
+    _resolve_batch_plan,
+    _run_batch,
+)
 from levels import create_level as create_level_by_name
 from levels.level_flat import create_level as create_level_flat
 from levels.level_mountains import create_level as create_level_mountains
 from ui.hud import HudOverlay
 
 
+_BASE_BATCH_CONFIG = RunConfig(
+    level_name="level_drop",
+    bot_name="turtle",
+    headless=True,
+    batch=True,
+    print_freq=0,
+    max_time=300.0,
+    max_steps=100,
+    plot_mode="none",
+    stop_on_crash=True,
+    stop_on_out_of_fuel=True,
+    stop_on_first_land=True,
+    seed=None,
+    lander_name=None,
+    batch_seeds="0-1",
+    batch_levels="level_drop",
+    batch_json=None,
+    batch_csv=None,
+    quick_benchmark=False,
+    batch_workers=2,
+)
+
+
 def test_bot_registry_only_exposes_turtle() -> None:
     bots = list_available_bots()
     assert "turtle" in bots
@@ -38,14 +70,6 @@ def test_bot_registry_only_exposes_turtle() -> None:
     assert turtle_bot.__class__.__name__ == "TurtleBot"
 
 
-class _FlatTerrain:
-    def __call__(self, _x: float, lod: int = 0) -> float:
-        return 0.0
-
-    def get_resolution(self, _lod: int) -> float:
-        return 1.0
-
-
 class _FixedTerrainLevel:
     def terrain(self, _x: float) -> float:
         return 20.0
@@ -64,7 +88,7 @@ class _ShortLevel(Level):
     def setup(self, _game, seed: int) -> None:
         _ = seed
         self.world = LevelWorld(
-            terrain=_FlatTerrain(),
+            terrain=FlatTerrain(),
             sites=LandingSiteSurfaceModel(),
             lander=Lander(start_pos=Vector2(0.0, 100.0)),
         )
@@ -106,7 +130,7 @@ class _TwoActorLevel(Level):
         actor_b.add_component(PlayerSelectable(order=1))
 
         self.world = LevelWorld(
-            terrain=_FlatTerrain(),
+            terrain=FlatTerrain(),
             sites=LandingSiteSurfaceModel(),
             lander=actor_a,
             actors=[actor_a, actor_b],
@@ -229,13 +253,16 @@ def test_game_assigns_passed_bot_to_bot_role_actor() -> None:
     assert game.actor_bots == {"actor_bot": bot}
 
 
-@pytest.mark.parametrize(
-    "level_factory",
-    [create_level_flat, create_level_mountains],
-)
-def test_level_presets_actor_spawns_are_above_local_terrain(level_factory) -> None:
-    level = level_factory()
-    game = LanderGame(level=level, bot=_PassiveBot(), headless=True, seed=123)
+@pytest.fixture(scope="module", params=[create_level_flat, create_level_mountains])
+def preset_game(request) -> tuple[LanderGame, _PassiveBot]:
+    # Built once per preset and shared by the read-only preset tests below.
+    bot = _PassiveBot()
+    game = LanderGame(level=request.param(), bot=bot, headless=True, seed=123)
+    return game, bot
+
+
+def test_level_presets_actor_spawns_are_above_local_terrain(preset_game) -> None:
+    game, _ = preset_game
     terrain = game.terrain
 
     actors = getattr(game.level.world, "actors", [])
@@ -258,14 +285,8 @@ def test_level_presets_actor_spawns_are_above_local_terrain(level_factory) -> No
             assert bottom - terrain(sx) >= 10.0
 
 
-@pytest.mark.parametrize(
-    "level_factory",
-    [create_level_flat, create_level_mountains],
-)
-def test_level_presets_assign_selected_bot_to_only_lander(level_factory) -> None:
-    level = level_factory()
-    bot = _PassiveBot()
-    game = LanderGame(level=level, bot=bot, headless=True, seed=123)
+def test_level_presets_assign_selected_bot_to_only_lander(preset_game) -> None:
+    game, bot = preset_game
 
     assert len(game.actors) == 1
     only_actor_uid = game.actors[0].uid
@@ -395,11 +416,27 @@ def test_eval_level_is_deterministic_for_seed_and_scenario() -> None:
     assert site_a.pos.y == site_b.pos.y
 
 
-def test_parse_seed_spec_supports_ranges_and_lists() -> None:
-    assert _parse_seed_spec("0-3") == [0, 1, 2, 3]
-    assert _parse_seed_spec("3-1") == [3, 2, 1]
-    assert _parse_seed_spec("1,3,5") == [1, 3, 5]
-    assert _parse_seed_spec("0-2,2,4") == [0, 1, 2, 4]
+@pytest.mark.parametrize(
+    ("spec", "expected"),
+    [
+        ("0-3", [0, 1, 2, 3]),
+        ("3-1", [3, 2, 1]),
+        ("1,3,5", [1, 3, 5]),
+        ("0-2,2,4", [0, 1, 2, 4]),
+    ],
+)
+def test_parse_seed_spec_supports_ranges_and_lists(spec: str, expected: list[int]) -> None:
+    assert _parse_seed_spec(spec) == expected
+
+
+def test_chunk_run_plan_preserves_order_and_coverage() -> None:
+    run_plan = [(seed, level) for level in ("level_drop", "level_drift") for seed in range(10)]
+
+    chunks = _chunk_run_plan(run_plan, worker_count=2)
+
+    assert len(chunks) > 1
+    assert [pair for chunk in chunks for pair in chunk] == run_plan
+    assert _chunk_run_plan(run_plan[:3], worker_count=8) == [[pair] for pair in run_plan[:3]]
 
 
 def test_resolve_batch_plan_uses_quick_benchmark_wave1_levels() -> None:
@@ -459,6 +496,18 @@ def test_eval_aggregate_summary_shape() -> None:
     assert "spawn_above_target" in summary["by_scenario"]
 
 
+def test_write_csv_records_fills_missing_columns(tmp_path) -> None:
+    records = [
+        {"seed": 0, "state": "landed", "plot_path": "a.png"},
+        {"seed": 1, "state": "crashed"},
+    ]
+
+    out = write_csv_records(tmp_path / "rows.csv", records)
+
+    lines = out.read_text(encoding="utf-8").splitlines()
+    assert lines == ["plot_path,seed,state", "a.png,0,landed", ",1,crashed"]
+
+
 def test_parse_args_defaults_to_quiet_batch_output() -> None:
     args = argparse.Namespace(
         level_name="level_drop",
@@ -480,9 +529,11 @@ def test_parse_args_defaults_to_quiet_batch_output() -> None:
         batch_csv=None,
         quick_benchmark=False,
         batch_workers=1,
+        batch_backend="process",
     )
     config = _parse_args(args)
     assert config.print_freq == 0
+    assert config.is_batch
 
 
 def test_hud_altitude_matches_passive_sensor_clearance_convention() -> None:
@@ -527,62 +578,64 @@ def test_run_batch_falls_back_when_parallel_executor_raises_runtime_error(
     monkeypatch.setattr(main_module, "ProcessPoolExecutor", _FailingExecutor)
     monkeypatch.setattr(main_module, "_resolve_batch_plan", _fake_plan)
     monkeypatch.setattr(main_module, "_run_once_record", _fake_run_once_record)
-    monkeypatch.setattr(main_module.os, "cpu_count", lambda: 8)
+    monkeypatch.setattr(main_module, "_usable_cpus", lambda: 8)
 
-    config = RunConfig(
-        level_name="level_drop",
-        bot_name="turtle",
-        headless=True,
-        batch=True,
-        print_freq=0,
-        max_time=300.0,
-        max_steps=100,
-        plot_mode="none",
-        stop_on_crash=True,
-        stop_on_out_of_fuel=True,
-        stop_on_first_land=True,
-        seed=None,
-        lander_name=None,
-        batch_seeds="0-1",
-        batch_levels="level_drop",
-        batch_json=None,
-        batch_csv=None,
-        quick_benchmark=False,
-        batch_workers=2,
-    )
-    exit_code = _run_batch(config)
+    exit_code = _run_batch(_BASE_BATCH_CONFIG)
     assert exit_code == 0
     out = capsys.readouterr().out
     assert "Batch workers unavailable (RuntimeError" in out
 
 
+def test_run_batch_thread_backend_keeps_plan_order(monkeypatch, capsys) -> None:
+    def _fake_plan(_config):
+        return [0, 1, 2, 3, 4], ["level_drop", "level_drift"]
+
+    def _fake_run_once_record(config, *, seed, level_name):
+        _ = config
+        return {"seed": seed, "level": level_name, "state": "landed", "success": True}
+
+    written: list[list[dict]] = []
+
+    def _fake_write_csv(_path, records):
+        written.append(records)
+        return _path
+
+    monkeypatch.setattr(main_module, "_resolve_batch_plan", _fake_plan)
+    monkeypatch.setattr(main_module, "_run_once_record", _fake_run_once_record)
+    monkeypatch.setattr(main_module, "write_csv_records", _fake_write_csv)
+    monkeypatch.setattr(main_module, "_usable_cpus", lambda: 8)
+
+    config = dataclasses.replace(
+        _BASE_BATCH_CONFIG,
+        batch_seeds="0-4",
+        batch_levels="level_drop,level_drift",
+        batch_csv="unused.csv",
+        batch_workers=3,
+        batch_backend="thread",
+    )
+    assert _run_batch(config) == 0
+    assert "Batch workers unavailable" not in capsys.readouterr().out
+    assert [(r["level"], r["seed"]) for r in written[0]] == [
+        (level, seed) for level in ("level_drop", "level_drift") for seed in range(5)
+    ]
+
+
+def test_run_batch_rejects_plotting_with_thread_backend() -> None:
+    config = dataclasses.replace(
+        _BASE_BATCH_CONFIG, plot_mode="speed", batch_workers=2, batch_backend="thread"
+    )
+
+    with pytest.raises(ValueError, match="--plot requires --batch-backend=process"):
+        _run_batch(config)
+
+
 def test_run_batch_rejects_empty_seed_plan(monkeypatch) -> None:
     def _fake_plan(_config):
         return [], ["level_drop"]
 
     monkeypatch.setattr(main_module, "_resolve_batch_plan", _fake_plan)
 
-    config = RunConfig(
-        level_name="level_drop",
-        bot_name="turtle",
-        headless=True,
-        batch=True,
-        print_freq=0,
-        max_time=300.0,
-        max_steps=100,
-        plot_mode="none",
-        stop_on_crash=True,
-        stop_on_out_of_fuel=True,
-        stop_on_first_land=True,
-        seed=None,
-        lander_name=None,
-        batch_seeds="",
-        batch_levels="level_drop",
-        batch_json=None,
-        batch_csv=None,
-        quick_benchmark=False,
-        batch_workers=2,
-    )
+    config = dataclasses.replace(_BASE_BATCH_CONFIG, batch_seeds="")
 
     with pytest.raises(ValueError, match="resolved no seeds"):
         _run_batch(config)
@@ -594,27 +647,7 @@ def test_run_batch_rejects_empty_level_plan(monkeypatch) -> None:
 
     monkeypatch.setattr(main_module, "_resolve_batch_plan", _fake_plan)
 
-    config = RunConfig(
-        level_name="level_drop",
-        bot_name="turtle",
-        headless=True,
-        batch=True,
-        print_freq=0,
-        max_time=300.0,
-        max_steps=100,
-        plot_mode="none",
-        stop_on_crash=True,
-        stop_on_out_of_fuel=True,
-        stop_on_first_land=True,
-        seed=None,
-        lander_name=None,
-        batch_seeds="0-1",
-        batch_levels="",
-        batch_json=None,
-        batch_csv=None,
-        quick_benchmark=False,
-        batch_workers=2,
-    )
+    config = dataclasses.replace(_BASE_BATCH_CONFIG, batch_levels="")
 
     with pytest.raises(ValueError, match="resolved no levels"):
         _run_batch(config)
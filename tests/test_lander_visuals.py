@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from core.lander_visuals import Thrust
+
+
+def test_thrust_direction_defaults_to_angle_unit_vector() -> None:
+    rotation = 0.6
+    cos_r = math.cos(rotation)
+    sin_r = math.sin(rotation)
+    angle = math.atan2(-cos_r, -sin_r)
+
+    derived = Thrust(x=0.0, y=0.0, angle=angle, width=4.0, length=20.0, power=1.0)
+    given = Thrust(
+        x=0.0, y=0.0, angle=angle, width=4.0, length=20.0, power=1.0, ux=-sin_r, uy=-cos_r
+    )
+
+    assert derived.ux == pytest.approx(given.ux)
+    assert derived.uy == pytest.approx(given.uy)
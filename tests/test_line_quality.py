@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from ui.line_quality import LineQualityController
+
+
+def test_line_quality_drops_and_restores_aa_with_hysteresis() -> None:
+    controller = LineQualityController(low_fps=45.0, high_fps=58.0, low_frames=3)
+
+    assert controller.update(0.0) is True
+    assert controller.update(30.0) is True
+    assert controller.update(60.0) is True  # a fast frame resets the slow streak
+    for _ in range(2):
+        assert controller.update(30.0) is True
+    assert controller.update(30.0) is False
+
+    # Between the thresholds keeps the reduced quality.
+    assert controller.update(50.0) is False
+    assert controller.update(59.0) is True
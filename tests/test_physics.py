@@ -2,22 +2,24 @@ from __future__ import annotations
 
 import math
 
+import numpy as np
 import pytest
+from fakes import FlatTerrain
 
 from core.maths import Vector2
 from core.physics import PhysicsEngine
 
 
-class _FlatTerrain:
-    def __call__(self, _x: float, lod: int = 0) -> float:
-        return 0.0
-
-    def get_resolution(self, _lod: int) -> float:
-        return 1.0
+def _flat_engine() -> PhysicsEngine:
+    # Fresh engine per test: tests attach/step bodies, so sharing one would couple them.
+    # A narrow terrain window keeps that cheap; every test stays within +/-100 of the origin.
+    return PhysicsEngine(
+        height_sampler=FlatTerrain(), gravity=(0.0, -9.8), half_width=200.0
+    )
 
 
 def test_closest_point_uses_vector_origin_signature() -> None:
-    engine = PhysicsEngine(height_sampler=_FlatTerrain(), gravity=(0.0, -9.8))
+    engine = _flat_engine()
     engine.attach_lander(
         width=8.0, height=8.0, mass=10.0, start_pos=Vector2(0.0, 20.0)
     )
@@ -26,11 +28,11 @@ def test_closest_point_uses_vector_origin_signature() -> None:
 
     assert isinstance(out, dict)
     assert out["distance"] >= 0.0
-    assert math.isclose(out["y"], 0.0, abs_tol=1e-6)
+    assert out["y"] == pytest.approx(0.0, abs=1e-6)
 
 
 def test_attach_lander_rejects_removed_start_xy_args() -> None:
-    engine = PhysicsEngine(height_sampler=_FlatTerrain(), gravity=(0.0, -9.8))
+    engine = _flat_engine()
     try:
         engine.attach_lander(width=8.0, height=8.0, mass=10.0, start_x=0.0, start_y=20.0)  # type: ignore[call-arg]
     except TypeError:
@@ -40,7 +42,7 @@ def test_attach_lander_rejects_removed_start_xy_args() -> None:
 
 
 def test_teleport_lander_clears_velocity_when_requested() -> None:
-    engine = PhysicsEngine(height_sampler=_FlatTerrain(), gravity=(0.0, -9.8))
+    engine = _flat_engine()
     engine.attach_lander(
         width=8.0, height=8.0, mass=10.0, start_pos=Vector2(0.0, 50.0)
     )
@@ -53,15 +55,13 @@ def test_teleport_lander_clears_velocity_when_requested() -> None:
     pose, angle = engine.get_pose()
     vel, ang_vel = engine.get_velocity()
 
-    assert math.isclose(pose.x, 5.0, abs_tol=1e-6)
-    assert math.isclose(pose.y, 40.0, abs_tol=1e-6)
-    assert math.isclose(angle, 0.25, abs_tol=1e-6)
-    assert math.isclose(vel.length(), 0.0, abs_tol=1e-6)
-    assert math.isclose(ang_vel, 0.0, abs_tol=1e-6)
+    assert (pose.x, pose.y, angle, vel.length(), ang_vel) == pytest.approx(
+        (5.0, 40.0, 0.25, 0.0, 0.0), abs=1e-6
+    )
 
 
 def test_engine_tracks_multiple_actor_bodies_by_uid() -> None:
-    engine = PhysicsEngine(height_sampler=_FlatTerrain(), gravity=(0.0, -9.8))
+    engine = _flat_engine()
     engine.attach_lander(
         width=8.0, height=8.0, mass=10.0, uid="a", start_pos=Vector2(0.0, 50.0)
     )
@@ -75,14 +75,13 @@ def test_engine_tracks_multiple_actor_bodies_by_uid() -> None:
     pose_a, _ = engine.get_pose(uid="a")
     pose_b, _ = engine.get_pose(uid="b")
 
-    assert math.isclose(pose_a.x, 5.0, abs_tol=1e-6)
-    assert math.isclose(pose_a.y, 40.0, abs_tol=1e-6)
-    assert math.isclose(pose_b.x, 20.0, abs_tol=1e-6)
-    assert math.isclose(pose_b.y, 50.0, abs_tol=1e-6)
+    assert (pose_a.x, pose_a.y, pose_b.x, pose_b.y) == pytest.approx(
+        (5.0, 40.0, 20.0, 50.0), abs=1e-6
+    )
 
 
 def test_landing_site_colliders_are_queryable_by_raycast() -> None:
-    engine = PhysicsEngine(height_sampler=_FlatTerrain(), gravity=(0.0, -9.8))
+    engine = _flat_engine()
     engine.set_landing_site_colliders([(0.0, 40.0, 100.0)])
 
     hit = engine.raycast(Vector2(0.0, 100.0), -math.pi / 2.0, 120.0)
@@ -101,19 +100,17 @@ class _WavyTerrain:
         return 10.0 * math.sin(x * 0.02) + 2.5 * math.cos(x * 0.11)
 
 
-def _window_vertices(engine: PhysicsEngine) -> list[tuple[float, float]]:
-    out: list[tuple[float, float]] = []
-    for seg in engine._terrain_shapes:
-        out.append((float(seg.a.x), float(seg.a.y)))
-    if engine._terrain_shapes:
-        last = engine._terrain_shapes[-1]
-        out.append((float(last.b.x), float(last.b.y)))
-    return out
+def _window_vertices(engine: PhysicsEngine) -> np.ndarray:
+    """Return the terrain window polyline as an (N + 1, 2) vertex array."""
+    shapes = engine._terrain_shapes
+    if not shapes:
+        return np.empty((0, 2))
+    return np.array([(seg.a.x, seg.a.y) for seg in shapes] + [tuple(shapes[-1].b)])
 
 
-def _is_step_aligned(x: float, step: float, tol: float = 1e-6) -> bool:
-    scaled = x / step
-    return abs(scaled - round(scaled)) <= tol
+def _is_step_aligned(xs: np.ndarray, step: float, tol: float = 1e-6) -> bool:
+    scaled = xs / step
+    return bool(np.all(np.abs(scaled - np.round(scaled)) <= tol))
 
 
 def test_terrain_window_rebuild_is_step_anchored_and_stable() -> None:
@@ -131,14 +128,77 @@ def test_terrain_window_rebuild_is_step_anchored_and_stable() -> None:
     engine._rebuild_window(97.0)
     verts_b = _window_vertices(engine)
 
-    assert verts_a
-    assert verts_b
-    assert all(_is_step_aligned(x, step) for x, _ in verts_a)
-    assert all(_is_step_aligned(x, step) for x, _ in verts_b)
+    assert len(verts_a)
+    assert len(verts_b)
+    assert _is_step_aligned(verts_a[:, 0], step)
+    assert _is_step_aligned(verts_b[:, 0], step)
 
-    map_a = {round(x, 6): y for x, y in verts_a}
-    map_b = {round(x, 6): y for x, y in verts_b}
-    common_xs = sorted(set(map_a.keys()) & set(map_b.keys()))
+    common_xs, idx_a, idx_b = np.intersect1d(
+        np.round(verts_a[:, 0], 6), np.round(verts_b[:, 0], 6), return_indices=True
+    )
     assert len(common_xs) > 5
-    for x_key in common_xs:
-        assert map_a[x_key] == pytest.approx(map_b[x_key])
+    assert np.allclose(verts_a[idx_a, 1], verts_b[idx_b, 1])
+
+
+class _FlushSiteTerrain:
+    """Flat ground that a test can flatten to ``site_y`` over ``[x_min, x_max]``."""
+
+    def __init__(self) -> None:
+        self.site: tuple[float, float, float] | None = None
+
+    def __call__(self, x: float, lod: int = 0) -> float:
+        _ = lod
+        if self.site is not None:
+            x_min, x_max, site_y = self.site
+            if x_min <= x <= x_max:
+                return site_y
+        return 0.0
+
+
+def _segment_heights(engine: PhysicsEngine, x_min: float, x_max: float) -> list[float]:
+    return [
+        y
+        for seg in engine._terrain_by_index.values()
+        for x, y in (seg.a, seg.b)
+        if x_min <= x <= x_max
+    ]
+
+
+def test_invalidate_terrain_resamples_cells_under_spawned_site() -> None:
+    terrain = _FlushSiteTerrain()
+    engine = PhysicsEngine(height_sampler=terrain, gravity=(0.0, -9.8), half_width=200.0)
+    engine.attach_lander(width=8.0, height=8.0, mass=10.0, start_pos=Vector2(0.0, 80.0))
+    engine.step(1.0 / 60.0)
+
+    terrain.site = (100.0, 150.0, 30.0)
+    engine.step(1.0 / 60.0)
+    assert set(_segment_heights(engine, 100.0, 150.0)) == {0.0}
+
+    engine.invalidate_terrain(100.0, 150.0)
+    engine.step(1.0 / 60.0)
+
+    assert set(_segment_heights(engine, 100.0, 150.0)) == {30.0}
+    assert set(_segment_heights(engine, -200.0, 90.0)) == {0.0}
+    assert len(engine._terrain_shapes) == len(engine._terrain_by_index)
+    assert all(seg in engine.space.shapes for seg in engine._terrain_shapes)
+
+
+def test_terrain_window_shift_drops_cells_that_left_the_window() -> None:
+    step = 10.0
+    engine = PhysicsEngine(
+        height_sampler=_WavyTerrain(), gravity=(0.0, -9.8), segment_step=step, half_width=120.0
+    )
+    engine._rebuild_window(0.0)
+    before = dict(engine._terrain_by_index)
+
+    engine._rebuild_window(75.0)
+
+    first = math.floor((75.0 - 120.0) / step)
+    last = math.ceil((75.0 + 120.0) / step)
+    assert sorted(engine._terrain_by_index) == list(range(first, last))
+    removed = [seg for i, seg in before.items() if not first <= i < last]
+    assert removed
+    space_shapes = engine.space.shapes
+    assert not any(seg in space_shapes for seg in removed)
+    terrain_in_space = [s for s in space_shapes if s not in engine._landing_site_shapes]
+    assert len(terrain_in_space) == last - first
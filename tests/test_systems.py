@@ -3,6 +3,8 @@ from __future__ import annotations
 import math
 from dataclasses import dataclass, field
 
+import pytest
+
 from bots.turtle import TurtleBot
 from core.bot import PassiveSensors, VehicleInfo
 from core.components import (
@@ -36,9 +38,24 @@ from core.systems.propulsion import PropulsionSystem
 from core.systems.refuel import RefuelSystem
 from core.systems.sensor_update import SensorUpdateSystem
 from core.systems.state_transition import StateTransitionSystem
+from fakes import FlatTerrain
+
+
+_FRAME_DT = 1.0 / 60.0
+_HALF_PI = math.pi / 2.0
 
 
 class _FakeEngineAdapter:
+    __slots__ = (
+        "actor_uids",
+        "forces",
+        "overrides",
+        "pose",
+        "pose_by_uid",
+        "velocity",
+        "velocity_by_uid",
+    )
+
     def __init__(self):
         self.forces: list[tuple[float, float]] = []
         self.overrides: list[float] = []
@@ -78,69 +95,73 @@ class _FakeEngineAdapter:
         return set(self.actor_uids)
 
 
+def _entity(*components, uid: str | None = None) -> Entity:
+    entity = Entity(uid=uid)
+    entity.add_components(*components)
+    return entity
+
+
+def _world(*entities: Entity) -> World:
+    world = World()
+    for entity in entities:
+        world.add_entity(entity)
+    return world
+
+
+def test_world_query_returns_entities_with_all_components_in_order() -> None:
+    full_a = _entity(Transform(), Engine(), uid="a")
+    partial = _entity(Transform(), uid="p")
+    full_b = _entity(Engine(), Transform(), FuelTank(), uid="b")
+    world = _world(full_a, partial, full_b)
+
+    assert world.get_entities_with(Transform, Engine) == [full_a, full_b]
+    assert world.get_entities_with(Transform) == [full_a, partial, full_b]
+    assert world.get_entities_with(FuelTank, Engine, Transform) == [full_b]
+    assert world.get_entities_with() == [full_a, partial, full_b]
+
+
 def test_propulsion_system_slews_controls_and_burns_fuel() -> None:
-    entity = Entity()
     engine = Engine(
         thrust_level=0.0,
         target_thrust=1.0,
         increase_rate=2.0,
         decrease_rate=4.0,
-        target_angle=math.pi / 2.0,
+        target_angle=_HALF_PI,
         max_rotation_rate=math.pi,
     )
     tank = FuelTank(fuel=10.0, burn_rate=1.0)
     trans = Transform(rotation=0.0)
-    entity.add_component(engine)
-    entity.add_component(tank)
-    entity.add_component(trans)
-
-    world = World()
-    world.add_entity(entity)
 
     system = PropulsionSystem()
-    system.world = world
+    system.world = _world(_entity(engine, tank, trans))
     system.update(0.5)
 
-    assert math.isclose(engine.thrust_level, 1.0, abs_tol=1e-6)
-    assert math.isclose(tank.fuel, 9.5, abs_tol=1e-6)
-    assert math.isclose(trans.rotation, math.pi / 2.0, abs_tol=1e-6)
+    assert (engine.thrust_level, tank.fuel, trans.rotation) == pytest.approx(
+        (1.0, 9.5, _HALF_PI), abs=1e-6
+    )
 
 
 def test_propulsion_system_forces_thrust_off_when_crashed() -> None:
-    entity = Entity()
     engine = Engine(thrust_level=0.8, target_thrust=1.0, target_angle=0.5)
     tank = FuelTank(fuel=10.0, burn_rate=1.0)
     trans = Transform(rotation=0.0)
-    state = LanderState(state="crashed")
-    entity.add_component(engine)
-    entity.add_component(tank)
-    entity.add_component(trans)
-    entity.add_component(state)
-
-    world = World()
-    world.add_entity(entity)
 
     system = PropulsionSystem()
-    system.world = world
+    system.world = _world(_entity(engine, tank, trans, LanderState(state="crashed")))
     system.update(0.5)
 
-    assert math.isclose(engine.thrust_level, 0.0, abs_tol=1e-6)
-    assert math.isclose(engine.target_thrust, 0.0, abs_tol=1e-6)
     # Fuel should not burn while crashed.
-    assert math.isclose(tank.fuel, 10.0, abs_tol=1e-6)
+    assert (engine.thrust_level, engine.target_thrust, tank.fuel) == pytest.approx(
+        (0.0, 0.0, 10.0), abs=1e-6
+    )
 
 
 def test_force_application_system_applies_thrust_and_override() -> None:
-    entity = Entity()
-    entity.add_component(Engine(thrust_level=0.5, max_power=100.0))
-    entity.add_component(Transform(rotation=0.0))
-
-    world = World()
-    world.add_entity(entity)
+    entity = _entity(Engine(thrust_level=0.5, max_power=100.0), Transform(rotation=0.0))
 
     adapter = _FakeEngineAdapter()
     system = ForceApplicationSystem(adapter)
-    system.world = world
+    system.world = _world(entity)
     system.update(1.0)
 
     assert adapter.forces == [(0.0, 50.0)]
@@ -151,28 +172,23 @@ def test_physics_sync_updates_single_lander_entity() -> None:
     adapter = _FakeEngineAdapter()
     system = PhysicsSyncSystem(adapter)
 
-    lander = Entity()
-    lander.add_component(Transform(pos=Vector2(0.0, 0.0)))
-    lander.add_component(PhysicsState(vel=Vector2(0.0, 0.0)))
-    lander.add_component(LanderState())
-
-    non_lander = Entity()
+    lander = _entity(
+        Transform(pos=Vector2(0.0, 0.0)),
+        PhysicsState(vel=Vector2(0.0, 0.0)),
+        LanderState(),
+    )
     non_lander_transform = Transform(pos=Vector2(99.0, 99.0))
     non_lander_physics = PhysicsState(vel=Vector2(9.0, 9.0))
-    non_lander.add_component(non_lander_transform)
-    non_lander.add_component(non_lander_physics)
 
-    world = World()
-    world.add_entity(lander)
-    world.add_entity(non_lander)
-    system.world = world
+    system.world = _world(lander, _entity(non_lander_transform, non_lander_physics))
 
-    system.update(1.0 / 60.0)
+    system.update(_FRAME_DT)
 
     lander_trans = lander.get_component(Transform)
     lander_phys = lander.get_component(PhysicsState)
     assert lander_trans is not None
     assert lander_phys is not None
+    assert isinstance(lander_trans.pos, Vector2) and isinstance(lander_phys.vel, Vector2)
     assert lander_trans.pos == Vector2(10.0, 20.0)
     assert lander_phys.vel == Vector2(1.0, -2.0)
 
@@ -181,53 +197,37 @@ def test_physics_sync_updates_single_lander_entity() -> None:
 
 
 def test_control_routing_updates_intent_and_engine_targets() -> None:
-    entity = Entity()
     intent = ControlIntent()
     engine = Engine(target_thrust=0.0, target_angle=0.0)
-    entity.add_component(intent)
-    entity.add_component(engine)
-
-    world = World()
-    world.add_entity(entity)
 
     system = ControlRoutingSystem()
-    system.world = world
+    system.world = _world(_entity(intent, engine))
     system.set_controls((0.75, 0.25, True))
-    system.update(1.0 / 60.0)
+    system.update(_FRAME_DT)
 
-    assert math.isclose(engine.target_thrust, 0.75, abs_tol=1e-6)
-    assert math.isclose(engine.target_angle, 0.25, abs_tol=1e-6)
+    assert (engine.target_thrust, engine.target_angle) == pytest.approx((0.75, 0.25), abs=1e-6)
     assert intent.refuel_requested is True
 
 
 def test_control_routing_accepts_per_actor_control_map() -> None:
-    a = Entity(uid="a")
-    b = Entity(uid="b")
     a_intent = ControlIntent()
     b_intent = ControlIntent()
     a_engine = Engine(target_thrust=0.0, target_angle=0.0)
     b_engine = Engine(target_thrust=0.5, target_angle=0.2)
-    a.add_component(a_intent)
-    a.add_component(a_engine)
-    b.add_component(b_intent)
-    b.add_component(b_engine)
-
-    world = World()
-    world.add_entity(a)
-    world.add_entity(b)
 
     system = ControlRoutingSystem()
-    system.world = world
+    system.world = _world(
+        _entity(a_intent, a_engine, uid="a"),
+        _entity(b_intent, b_engine, uid="b"),
+    )
     system.set_controls_map({"a": (0.8, 0.4, True)})
-    system.update(1.0 / 60.0)
+    system.update(_FRAME_DT)
 
-    assert math.isclose(a_engine.target_thrust, 0.8, abs_tol=1e-6)
-    assert math.isclose(a_engine.target_angle, 0.4, abs_tol=1e-6)
+    assert (a_engine.target_thrust, a_engine.target_angle) == pytest.approx((0.8, 0.4), abs=1e-6)
     assert a_intent.refuel_requested is True
 
     # b gets no explicit controls this frame (only refuel resets)
-    assert math.isclose(b_engine.target_thrust, 0.5, abs_tol=1e-6)
-    assert math.isclose(b_engine.target_angle, 0.2, abs_tol=1e-6)
+    assert (b_engine.target_thrust, b_engine.target_angle) == pytest.approx((0.5, 0.2), abs=1e-6)
     assert b_intent.refuel_requested is False
 
 
@@ -244,18 +244,11 @@ def test_physics_sync_updates_multiple_entities_with_actor_uids() -> None:
     }
     system = PhysicsSyncSystem(adapter)
 
-    a = Entity(uid="a")
-    a.add_component(Transform(pos=Vector2(0.0, 0.0)))
-    a.add_component(PhysicsState(vel=Vector2(0.0, 0.0)))
-    b = Entity(uid="b")
-    b.add_component(Transform(pos=Vector2(0.0, 0.0)))
-    b.add_component(PhysicsState(vel=Vector2(0.0, 0.0)))
+    a = _entity(Transform(pos=Vector2(0.0, 0.0)), PhysicsState(vel=Vector2(0.0, 0.0)), uid="a")
+    b = _entity(Transform(pos=Vector2(0.0, 0.0)), PhysicsState(vel=Vector2(0.0, 0.0)), uid="b")
 
-    world = World()
-    world.add_entity(a)
-    world.add_entity(b)
-    system.world = world
-    system.update(1.0 / 60.0)
+    system.world = _world(a, b)
+    system.update(_FRAME_DT)
 
     a_trans = a.get_component(Transform)
     a_phys = a.get_component(PhysicsState)
@@ -263,6 +256,7 @@ def test_physics_sync_updates_multiple_entities_with_actor_uids() -> None:
     b_phys = b.get_component(PhysicsState)
     assert a_trans is not None and a_phys is not None
     assert b_trans is not None and b_phys is not None
+    assert all(isinstance(v, Vector2) for v in (a_trans.pos, a_phys.vel, b_trans.pos, b_phys.vel))
     assert a_trans.pos == Vector2(1.0, 2.0)
     assert a_phys.vel == Vector2(5.0, 6.0)
     assert b_trans.pos == Vector2(3.0, 4.0)
@@ -270,18 +264,16 @@ def test_physics_sync_updates_multiple_entities_with_actor_uids() -> None:
 
 
 def test_state_transition_takes_off_when_landed_and_thrust_requested() -> None:
-    entity = Entity()
-    entity.add_component(LanderState(state="landed"))
-    entity.add_component(Engine(target_thrust=0.2))
-    entity.add_component(Transform(pos=Vector2(0.0, 10.0)))
-    entity.add_component(FuelTank(fuel=10.0))
-
-    world = World()
-    world.add_entity(entity)
+    entity = _entity(
+        LanderState(state="landed"),
+        Engine(target_thrust=0.2),
+        Transform(pos=Vector2(0.0, 10.0)),
+        FuelTank(fuel=10.0),
+    )
     system = StateTransitionSystem()
-    system.world = world
+    system.world = _world(entity)
 
-    system.update(1.0 / 60.0)
+    system.update(_FRAME_DT)
 
     ls = entity.get_component(LanderState)
     trans = entity.get_component(Transform)
@@ -291,7 +283,7 @@ def test_state_transition_takes_off_when_landed_and_thrust_requested() -> None:
     assert math.isclose(trans.pos.y, 11.0, abs_tol=1e-6)
 
 
-@dataclass
+@dataclass(slots=True)
 class _Target:
     x: float
     y: float
@@ -307,6 +299,8 @@ class _Target:
 
 
 class _Targets:
+    __slots__ = ("target",)
+
     def __init__(self, target):
         self.target = target
 
@@ -314,16 +308,8 @@ class _Targets:
         return [self.target]
 
 
-class _FlatTerrain:
-    def __call__(self, _x: float, lod: int = 0) -> float:
-        _ = lod
-        return 0.0
-
-    def get_resolution(self, _lod: int) -> float:
-        return 1.0
-
-
 class _FakeContactAdapter:
+    __slots__ = ()
     enabled = False
 
     def get_contact_report(self) -> dict:
@@ -334,6 +320,7 @@ class _FakeContactAdapter:
 
 
 class _FakeCollidingContactAdapter:
+    __slots__ = ()
     enabled = False
 
     def get_contact_report(self) -> dict:
@@ -344,20 +331,19 @@ class _FakeCollidingContactAdapter:
 
 
 def test_refuel_system_transfers_fuel_and_spends_credits() -> None:
-    entity = Entity()
-    entity.add_component(LanderState(state="landed"))
-    entity.add_component(FuelTank(fuel=10.0, max_fuel=20.0))
-    entity.add_component(Wallet(credits=50.0))
-    entity.add_component(Transform(pos=Vector2(0.0, 5.0)))
-    entity.add_component(LanderGeometry(width=8.0, height=8.0))
-    entity.add_component(RefuelConfig(refuel_rate=5.0))
-    entity.add_component(ControlIntent(refuel_requested=True))
+    entity = _entity(
+        LanderState(state="landed"),
+        FuelTank(fuel=10.0, max_fuel=20.0),
+        Wallet(credits=50.0),
+        Transform(pos=Vector2(0.0, 5.0)),
+        LanderGeometry(width=8.0, height=8.0),
+        RefuelConfig(refuel_rate=5.0),
+        ControlIntent(refuel_requested=True),
+    )
     sites = _Targets(_Target(x=0.0, y=0.0, size=20.0, fuel_price=2.0))
 
-    world = World()
-    world.add_entity(entity)
     system = RefuelSystem(sites)
-    system.world = world
+    system.world = _world(entity)
 
     system.update(1.0)
 
@@ -365,23 +351,21 @@ def test_refuel_system_transfers_fuel_and_spends_credits() -> None:
     wallet = entity.get_component(Wallet)
     assert tank is not None
     assert wallet is not None
-    assert math.isclose(tank.fuel, 15.0, abs_tol=1e-6)
-    assert math.isclose(wallet.credits, 40.0, abs_tol=1e-6)
+    assert (tank.fuel, wallet.credits) == pytest.approx((15.0, 40.0), abs=1e-6)
 
 
 def test_sensor_update_system_populates_cached_readings() -> None:
-    entity = Entity()
-    entity.add_component(Transform(pos=Vector2(0.0, 100.0)))
-    entity.add_component(Radar(inner_range=2000.0, outer_range=5000.0))
-    entity.add_component(RefuelConfig(proximity_sensor_range=500.0))
     readings = SensorReadings()
-    entity.add_component(readings)
+    entity = _entity(
+        Transform(pos=Vector2(0.0, 100.0)),
+        Radar(inner_range=2000.0, outer_range=5000.0),
+        RefuelConfig(proximity_sensor_range=500.0),
+        readings,
+    )
     sites = _Targets(_Target(x=50.0, y=0.0, size=20.0))
 
-    world = World()
-    world.add_entity(entity)
-    system = SensorUpdateSystem(_FlatTerrain(), sites)
-    system.world = world
+    system = SensorUpdateSystem(FlatTerrain(), sites)
+    system.world = _world(entity)
 
     system.update(1.0 / 10.0)
 
@@ -398,6 +382,8 @@ def test_sensor_update_system_populates_cached_readings() -> None:
 
 
 class _BotActiveSensors:
+    __slots__ = ("hill_height", "hill_width", "hill_x")
+
     def __init__(self, hill_x: float, hill_width: float, hill_height: float):
         self.hill_x = hill_x
         self.hill_width = hill_width
@@ -432,65 +418,101 @@ class _BotActiveSensors:
         return out
 
 
-def test_turtle_bot_enters_climb_mode_for_above_blocked_target() -> None:
+# Stateless, so one instance serves every scenario with no obstacle near the pads.
+_NO_HILL_SENSORS = _BotActiveSensors(hill_x=1000.0, hill_width=10.0, hill_height=1.0)
+
+
+_TURTLE_VEHICLE = VehicleInfo(
+    width=8.0,
+    height=8.0,
+    dry_mass=1.0,
+    fuel_density=0.01,
+    max_thrust_power=50.0,
+    safe_landing_velocity=10.0,
+    safe_landing_angle=math.radians(15.0),
+    radar_outer_range=5000.0,
+    radar_inner_range=2000.0,
+    proximity_sensor_range=500.0,
+)
+
+# Per-field defaults shared by the turtle-bot scenarios; each test overrides the
+# position/velocity fields it is actually about.
+_PASSIVE_DEFAULTS = {
+    "terrain_y": 0.0,
+    "terrain_slope": 0.0,
+    "vx": 0.0,
+    "vy_up": 0.0,
+    "angle": 0.0,
+    "ax": 0.0,
+    "ay_up": 0.0,
+    "mass": 2.0,
+    "thrust_level": 0.0,
+    "fuel": 100.0,
+    "state": "flying",
+}
+
+
+def _turtle_bot() -> TurtleBot:
     bot = TurtleBot()
-    bot.set_vehicle_info(
-        VehicleInfo(
-            width=8.0,
-            height=8.0,
-            dry_mass=1.0,
-            fuel_density=0.01,
-            max_thrust_power=50.0,
-            safe_landing_velocity=10.0,
-            safe_landing_angle=math.radians(15.0),
-            radar_outer_range=5000.0,
-            radar_inner_range=2000.0,
-            proximity_sensor_range=500.0,
-        )
+    bot.set_vehicle_info(_TURTLE_VEHICLE)
+    return bot
+
+
+def _passive(**fields) -> PassiveSensors:
+    return PassiveSensors(**{**_PASSIVE_DEFAULTS, **fields})
+
+
+def _contact(
+    uid: str,
+    *,
+    x: float,
+    y: float,
+    rel_x: float,
+    rel_y: float,
+    size: float,
+    inner: bool,
+) -> RadarContact:
+    return RadarContact(
+        uid=uid,
+        x=x,
+        y=y,
+        size=size,
+        angle=math.atan2(rel_y, rel_x),
+        distance=math.hypot(rel_x, rel_y),
+        rel_x=rel_x,
+        rel_y=rel_y,
+        is_inner_lock=inner,
+        info={"award": 250.0},
+    )
+
+
+def _ground_below(x: float, *, distance: float, ground_y: float = 0.0) -> ProximityContact:
+    return ProximityContact(
+        x=x,
+        y=ground_y,
+        angle=-_HALF_PI,
+        distance=distance,
+        normal_x=0.0,
+        normal_y=1.0,
+        terrain_slope=0.0,
     )
 
-    passive = PassiveSensors(
+
+def test_turtle_bot_enters_climb_mode_for_above_blocked_target() -> None:
+    bot = _turtle_bot()
+
+    passive = _passive(
         x=0.0,
         y=40.0,
         altitude=36.0,
-        terrain_y=0.0,
-        terrain_slope=0.0,
-        vx=0.0,
-        vy_up=0.0,
-        angle=0.0,
-        ax=0.0,
-        ay_up=0.0,
-        mass=2.0,
-        thrust_level=0.0,
-        fuel=100.0,
-        state="flying",
         radar_contacts=[
-            RadarContact(
-                uid="site_above",
-                x=220.0,
-                y=120.0,
-                size=70.0,
-                angle=math.atan2(80.0, 220.0),
-                distance=math.hypot(220.0, 80.0),
-                rel_x=220.0,
-                rel_y=80.0,
-                is_inner_lock=True,
-                info={"award": 250.0},
-            )
+            _contact("site_above", x=220.0, y=120.0, rel_x=220.0, rel_y=80.0, size=70.0, inner=True)
         ],
-        proximity=ProximityContact(
-            x=0.0,
-            y=0.0,
-            angle=-math.pi / 2.0,
-            distance=40.0,
-            normal_x=0.0,
-            normal_y=1.0,
-            terrain_slope=0.0,
-        ),
+        proximity=_ground_below(0.0, distance=40.0),
     )
 
     sensors = _BotActiveSensors(hill_x=100.0, hill_width=60.0, hill_height=90.0)
-    action = bot.update(1.0 / 60.0, passive, sensors)
+    action = bot.update(_FRAME_DT, passive, sensors)
 
     assert "CLB" in action.status
     assert "STG:climb_clearance" in action.status
@@ -498,64 +520,27 @@ def test_turtle_bot_enters_climb_mode_for_above_blocked_target() -> None:
 
 
 def test_turtle_bot_keeps_climbing_when_under_elevated_target() -> None:
-    bot = TurtleBot()
-    bot.set_vehicle_info(
-        VehicleInfo(
-            width=8.0,
-            height=8.0,
-            dry_mass=1.0,
-            fuel_density=0.01,
-            max_thrust_power=50.0,
-            safe_landing_velocity=10.0,
-            safe_landing_angle=math.radians(15.0),
-            radar_outer_range=5000.0,
-            radar_inner_range=2000.0,
-            proximity_sensor_range=500.0,
-        )
-    )
+    bot = _turtle_bot()
 
-    passive = PassiveSensors(
+    passive = _passive(
         x=190.0,
         y=40.0,
         altitude=36.0,
-        terrain_y=0.0,
-        terrain_slope=0.0,
-        vx=0.0,
-        vy_up=0.0,
-        angle=0.0,
-        ax=0.0,
-        ay_up=0.0,
-        mass=2.0,
-        thrust_level=0.0,
-        fuel=100.0,
-        state="flying",
         radar_contacts=[
-            RadarContact(
-                uid="site_above_close_x",
+            _contact(
+                "site_above_close_x",
                 x=220.0,
                 y=120.0,
-                size=70.0,
-                angle=math.atan2(80.0, 30.0),
-                distance=math.hypot(30.0, 80.0),
                 rel_x=30.0,
                 rel_y=80.0,
-                is_inner_lock=True,
-                info={"award": 250.0},
+                size=70.0,
+                inner=True,
             )
         ],
-        proximity=ProximityContact(
-            x=190.0,
-            y=0.0,
-            angle=-math.pi / 2.0,
-            distance=40.0,
-            normal_x=0.0,
-            normal_y=1.0,
-            terrain_slope=0.0,
-        ),
+        proximity=_ground_below(190.0, distance=40.0),
     )
 
-    sensors = _BotActiveSensors(hill_x=1000.0, hill_width=10.0, hill_height=1.0)
-    action = bot.update(1.0 / 60.0, passive, sensors)
+    action = bot.update(_FRAME_DT, passive, _NO_HILL_SENSORS)
 
     assert "CLB" in action.status
     assert "STG:climb_clearance" in action.status
@@ -563,64 +548,21 @@ def test_turtle_bot_keeps_climbing_when_under_elevated_target() -> None:
 
 
 def test_turtle_bot_does_not_reselect_blacklisted_contact_on_fallback() -> None:
-    bot = TurtleBot()
-    bot.set_vehicle_info(
-        VehicleInfo(
-            width=8.0,
-            height=8.0,
-            dry_mass=1.0,
-            fuel_density=0.01,
-            max_thrust_power=50.0,
-            safe_landing_velocity=10.0,
-            safe_landing_angle=math.radians(15.0),
-            radar_outer_range=5000.0,
-            radar_inner_range=2000.0,
-            proximity_sensor_range=500.0,
-        )
-    )
+    bot = _turtle_bot()
     bot._target_uid_blacklist.add("blocked_site")
 
-    passive = PassiveSensors(
+    passive = _passive(
         x=100.0,
         y=40.0,
         altitude=20.0,
         terrain_y=16.0,
-        terrain_slope=0.0,
-        vx=0.0,
-        vy_up=0.0,
-        angle=0.0,
-        ax=0.0,
-        ay_up=0.0,
-        mass=2.0,
-        thrust_level=0.0,
-        fuel=100.0,
-        state="flying",
         radar_contacts=[
-            RadarContact(
-                uid="blocked_site",
-                x=104.0,
-                y=36.0,
-                size=80.0,
-                angle=math.atan2(-4.0, 4.0),
-                distance=math.hypot(4.0, -4.0),
-                rel_x=4.0,
-                rel_y=-4.0,
-                is_inner_lock=True,
-                info={"award": 250.0},
-            )
+            _contact("blocked_site", x=104.0, y=36.0, rel_x=4.0, rel_y=-4.0, size=80.0, inner=True)
         ],
-        proximity=ProximityContact(
-            x=100.0,
-            y=16.0,
-            angle=-math.pi / 2.0,
-            distance=24.0,
-            normal_x=0.0,
-            normal_y=1.0,
-            terrain_slope=0.0,
-        ),
+        proximity=_ground_below(100.0, distance=24.0, ground_y=16.0),
     )
 
-    sensors = _BotActiveSensors(hill_x=1000.0, hill_width=10.0, hill_height=1.0)
+    sensors = _NO_HILL_SENSORS
     _ = bot.update(1.0, passive, sensors)
 
     # If fallback reselected the blacklisted target, hover-stuck timer would increase.
@@ -628,77 +570,37 @@ def test_turtle_bot_does_not_reselect_blacklisted_contact_on_fallback() -> None:
 
 
 def test_turtle_bot_falls_back_to_outer_contacts_when_inner_are_blacklisted() -> None:
-    bot = TurtleBot()
-    bot.set_vehicle_info(
-        VehicleInfo(
-            width=8.0,
-            height=8.0,
-            dry_mass=1.0,
-            fuel_density=0.01,
-            max_thrust_power=50.0,
-            safe_landing_velocity=10.0,
-            safe_landing_angle=math.radians(15.0),
-            radar_outer_range=5000.0,
-            radar_inner_range=2000.0,
-            proximity_sensor_range=500.0,
-        )
-    )
+    bot = _turtle_bot()
     bot._target_uid_blacklist.add("inner_blocked")
 
-    passive = PassiveSensors(
+    passive = _passive(
         x=0.0,
         y=30.0,
         altitude=26.0,
-        terrain_y=0.0,
-        terrain_slope=0.0,
-        vx=0.0,
-        vy_up=0.0,
-        angle=0.0,
-        ax=0.0,
-        ay_up=0.0,
-        mass=2.0,
-        thrust_level=0.0,
-        fuel=100.0,
-        state="flying",
         radar_contacts=[
-            RadarContact(
-                uid="inner_blocked",
+            _contact(
+                "inner_blocked",
                 x=-120.0,
                 y=30.0,
-                size=80.0,
-                angle=math.atan2(0.0, -120.0),
-                distance=120.0,
                 rel_x=-120.0,
                 rel_y=0.0,
-                is_inner_lock=True,
-                info={"award": 250.0},
+                size=80.0,
+                inner=True,
             ),
-            RadarContact(
-                uid="outer_available",
+            _contact(
+                "outer_available",
                 x=180.0,
                 y=10.0,
-                size=80.0,
-                angle=math.atan2(-20.0, 180.0),
-                distance=math.hypot(180.0, -20.0),
                 rel_x=180.0,
                 rel_y=-20.0,
-                is_inner_lock=False,
-                info={"award": 250.0},
+                size=80.0,
+                inner=False,
             ),
         ],
-        proximity=ProximityContact(
-            x=0.0,
-            y=0.0,
-            angle=-math.pi / 2.0,
-            distance=30.0,
-            normal_x=0.0,
-            normal_y=1.0,
-            terrain_slope=0.0,
-        ),
+        proximity=_ground_below(0.0, distance=30.0),
     )
 
-    sensors = _BotActiveSensors(hill_x=1000.0, hill_width=10.0, hill_height=1.0)
-    action = bot.update(1.0 / 60.0, passive, sensors)
+    action = bot.update(_FRAME_DT, passive, _NO_HILL_SENSORS)
 
     # With the inner contact blacklisted, the bot should still track the outer
     # right-side contact instead of running targetless.
@@ -706,76 +608,36 @@ def test_turtle_bot_falls_back_to_outer_contacts_when_inner_are_blacklisted() ->
 
 
 def test_turtle_bot_penalizes_moving_named_outer_contacts() -> None:
-    bot = TurtleBot()
-    bot.set_vehicle_info(
-        VehicleInfo(
-            width=8.0,
-            height=8.0,
-            dry_mass=1.0,
-            fuel_density=0.01,
-            max_thrust_power=50.0,
-            safe_landing_velocity=10.0,
-            safe_landing_angle=math.radians(15.0),
-            radar_outer_range=5000.0,
-            radar_inner_range=2000.0,
-            proximity_sensor_range=500.0,
-        )
-    )
+    bot = _turtle_bot()
 
-    passive = PassiveSensors(
+    passive = _passive(
         x=0.0,
         y=30.0,
         altitude=26.0,
-        terrain_y=0.0,
-        terrain_slope=0.0,
-        vx=0.0,
-        vy_up=0.0,
-        angle=0.0,
-        ax=0.0,
-        ay_up=0.0,
-        mass=2.0,
-        thrust_level=0.0,
-        fuel=100.0,
-        state="flying",
         radar_contacts=[
-            RadarContact(
-                uid="moving_outer_right",
+            _contact(
+                "moving_outer_right",
                 x=120.0,
                 y=30.0,
-                size=80.0,
-                angle=math.atan2(0.0, 120.0),
-                distance=120.0,
                 rel_x=120.0,
                 rel_y=0.0,
-                is_inner_lock=False,
-                info={"award": 250.0},
+                size=80.0,
+                inner=False,
             ),
-            RadarContact(
-                uid="stable_outer_left",
+            _contact(
+                "stable_outer_left",
                 x=-160.0,
                 y=30.0,
-                size=80.0,
-                angle=math.atan2(0.0, -160.0),
-                distance=160.0,
                 rel_x=-160.0,
                 rel_y=0.0,
-                is_inner_lock=False,
-                info={"award": 250.0},
+                size=80.0,
+                inner=False,
             ),
         ],
-        proximity=ProximityContact(
-            x=0.0,
-            y=0.0,
-            angle=-math.pi / 2.0,
-            distance=30.0,
-            normal_x=0.0,
-            normal_y=1.0,
-            terrain_slope=0.0,
-        ),
+        proximity=_ground_below(0.0, distance=30.0),
     )
 
-    sensors = _BotActiveSensors(hill_x=1000.0, hill_width=10.0, hill_height=1.0)
-    action = bot.update(1.0 / 60.0, passive, sensors)
+    action = bot.update(_FRAME_DT, passive, _NO_HILL_SENSORS)
 
     # The closer right-side target is marked moving by uid and should be
     # penalized, so the stable left-side target is preferred.
@@ -783,76 +645,36 @@ def test_turtle_bot_penalizes_moving_named_outer_contacts() -> None:
 
 
 def test_turtle_bot_filters_high_outer_contacts_by_vertical_offset() -> None:
-    bot = TurtleBot()
-    bot.set_vehicle_info(
-        VehicleInfo(
-            width=8.0,
-            height=8.0,
-            dry_mass=1.0,
-            fuel_density=0.01,
-            max_thrust_power=50.0,
-            safe_landing_velocity=10.0,
-            safe_landing_angle=math.radians(15.0),
-            radar_outer_range=5000.0,
-            radar_inner_range=2000.0,
-            proximity_sensor_range=500.0,
-        )
-    )
+    bot = _turtle_bot()
 
-    passive = PassiveSensors(
+    passive = _passive(
         x=0.0,
         y=30.0,
         altitude=26.0,
-        terrain_y=0.0,
-        terrain_slope=0.0,
-        vx=0.0,
-        vy_up=0.0,
-        angle=0.0,
-        ax=0.0,
-        ay_up=0.0,
-        mass=2.0,
-        thrust_level=0.0,
-        fuel=100.0,
-        state="flying",
         radar_contacts=[
-            RadarContact(
-                uid="outer_high_right",
+            _contact(
+                "outer_high_right",
                 x=140.0,
                 y=250.0,
-                size=80.0,
-                angle=math.atan2(220.0, 140.0),
-                distance=math.hypot(140.0, 220.0),
                 rel_x=140.0,
                 rel_y=220.0,
-                is_inner_lock=False,
-                info={"award": 250.0},
+                size=80.0,
+                inner=False,
             ),
-            RadarContact(
-                uid="outer_level_left",
+            _contact(
+                "outer_level_left",
                 x=-190.0,
                 y=30.0,
-                size=80.0,
-                angle=math.atan2(0.0, -190.0),
-                distance=190.0,
                 rel_x=-190.0,
                 rel_y=0.0,
-                is_inner_lock=False,
-                info={"award": 250.0},
+                size=80.0,
+                inner=False,
             ),
         ],
-        proximity=ProximityContact(
-            x=0.0,
-            y=0.0,
-            angle=-math.pi / 2.0,
-            distance=30.0,
-            normal_x=0.0,
-            normal_y=1.0,
-            terrain_slope=0.0,
-        ),
+        proximity=_ground_below(0.0, distance=30.0),
     )
 
-    sensors = _BotActiveSensors(hill_x=1000.0, hill_width=10.0, hill_height=1.0)
-    action = bot.update(1.0 / 60.0, passive, sensors)
+    action = bot.update(_FRAME_DT, passive, _NO_HILL_SENSORS)
 
     # The high-above outer contact should be filtered by dy > 120, leaving the
     # level left-side outer contact as the preferred candidate.
@@ -860,76 +682,28 @@ def test_turtle_bot_filters_high_outer_contacts_by_vertical_offset() -> None:
 
 
 def test_turtle_bot_prefers_inner_lock_contacts_for_scoring() -> None:
-    bot = TurtleBot()
-    bot.set_vehicle_info(
-        VehicleInfo(
-            width=8.0,
-            height=8.0,
-            dry_mass=1.0,
-            fuel_density=0.01,
-            max_thrust_power=50.0,
-            safe_landing_velocity=10.0,
-            safe_landing_angle=math.radians(15.0),
-            radar_outer_range=5000.0,
-            radar_inner_range=2000.0,
-            proximity_sensor_range=500.0,
-        )
-    )
+    bot = _turtle_bot()
 
-    passive = PassiveSensors(
+    passive = _passive(
         x=0.0,
         y=30.0,
         altitude=26.0,
-        terrain_y=0.0,
-        terrain_slope=0.0,
-        vx=0.0,
-        vy_up=0.0,
-        angle=0.0,
-        ax=0.0,
-        ay_up=0.0,
-        mass=2.0,
-        thrust_level=0.0,
-        fuel=100.0,
-        state="flying",
         radar_contacts=[
-            RadarContact(
-                uid="inner_left",
-                x=-220.0,
-                y=30.0,
-                size=80.0,
-                angle=math.atan2(0.0, -220.0),
-                distance=220.0,
-                rel_x=-220.0,
-                rel_y=0.0,
-                is_inner_lock=True,
-                info={"award": 250.0},
-            ),
-            RadarContact(
-                uid="outer_right",
+            _contact("inner_left", x=-220.0, y=30.0, rel_x=-220.0, rel_y=0.0, size=80.0, inner=True),
+            _contact(
+                "outer_right",
                 x=160.0,
                 y=-150.0,
-                size=80.0,
-                angle=math.atan2(-180.0, 160.0),
-                distance=math.hypot(160.0, -180.0),
                 rel_x=160.0,
                 rel_y=-180.0,
-                is_inner_lock=False,
-                info={"award": 250.0},
+                size=80.0,
+                inner=False,
             ),
         ],
-        proximity=ProximityContact(
-            x=0.0,
-            y=0.0,
-            angle=-math.pi / 2.0,
-            distance=30.0,
-            normal_x=0.0,
-            normal_y=1.0,
-            terrain_slope=0.0,
-        ),
+        proximity=_ground_below(0.0, distance=30.0),
     )
 
-    sensors = _BotActiveSensors(hill_x=1000.0, hill_width=10.0, hill_height=1.0)
-    action = bot.update(1.0 / 60.0, passive, sensors)
+    action = bot.update(_FRAME_DT, passive, _NO_HILL_SENSORS)
 
     # Inner lock is on the left; if outer-range contact were scored equally,
     # this setup tends to pull the command to the right.
@@ -937,243 +711,111 @@ def test_turtle_bot_prefers_inner_lock_contacts_for_scoring() -> None:
 
 
 def test_turtle_bot_enters_approach_stage_when_near_target() -> None:
-    bot = TurtleBot()
-    bot.set_vehicle_info(
-        VehicleInfo(
-            width=8.0,
-            height=8.0,
-            dry_mass=1.0,
-            fuel_density=0.01,
-            max_thrust_power=50.0,
-            safe_landing_velocity=10.0,
-            safe_landing_angle=math.radians(15.0),
-            radar_outer_range=5000.0,
-            radar_inner_range=2000.0,
-            proximity_sensor_range=500.0,
-        )
-    )
+    bot = _turtle_bot()
 
-    passive = PassiveSensors(
+    passive = _passive(
         x=180.0,
         y=45.0,
         altitude=41.0,
-        terrain_y=0.0,
-        terrain_slope=0.0,
         vx=3.0,
         vy_up=-0.5,
-        angle=0.0,
-        ax=0.0,
-        ay_up=0.0,
-        mass=2.0,
-        thrust_level=0.0,
-        fuel=100.0,
-        state="flying",
         radar_contacts=[
-            RadarContact(
-                uid="approach_site",
+            _contact(
+                "approach_site",
                 x=220.0,
                 y=30.0,
-                size=70.0,
-                angle=math.atan2(-15.0, 40.0),
-                distance=math.hypot(40.0, -15.0),
                 rel_x=40.0,
                 rel_y=-15.0,
-                is_inner_lock=True,
-                info={"award": 250.0},
+                size=70.0,
+                inner=True,
             )
         ],
-        proximity=ProximityContact(
-            x=180.0,
-            y=0.0,
-            angle=-math.pi / 2.0,
-            distance=45.0,
-            normal_x=0.0,
-            normal_y=1.0,
-            terrain_slope=0.0,
-        ),
+        proximity=_ground_below(180.0, distance=45.0),
     )
 
-    sensors = _BotActiveSensors(hill_x=1000.0, hill_width=10.0, hill_height=1.0)
-    action = bot.update(1.0 / 60.0, passive, sensors)
+    action = bot.update(_FRAME_DT, passive, _NO_HILL_SENSORS)
 
     assert "STG:approach_align" in action.status
 
 
 def test_turtle_bot_enters_final_descent_stage_when_aligned_and_low() -> None:
-    bot = TurtleBot()
-    bot.set_vehicle_info(
-        VehicleInfo(
-            width=8.0,
-            height=8.0,
-            dry_mass=1.0,
-            fuel_density=0.01,
-            max_thrust_power=50.0,
-            safe_landing_velocity=10.0,
-            safe_landing_angle=math.radians(15.0),
-            radar_outer_range=5000.0,
-            radar_inner_range=2000.0,
-            proximity_sensor_range=500.0,
-        )
-    )
+    bot = _turtle_bot()
 
-    passive = PassiveSensors(
+    passive = _passive(
         x=219.0,
         y=35.0,
         altitude=31.0,
-        terrain_y=0.0,
-        terrain_slope=0.0,
         vx=0.5,
         vy_up=-0.2,
-        angle=0.0,
-        ax=0.0,
-        ay_up=0.0,
-        mass=2.0,
-        thrust_level=0.0,
-        fuel=100.0,
-        state="flying",
         radar_contacts=[
-            RadarContact(
-                uid="touchdown_site",
+            _contact(
+                "touchdown_site",
                 x=220.0,
                 y=30.0,
-                size=70.0,
-                angle=math.atan2(-5.0, 1.0),
-                distance=math.hypot(1.0, -5.0),
                 rel_x=1.0,
                 rel_y=-5.0,
-                is_inner_lock=True,
-                info={"award": 250.0},
+                size=70.0,
+                inner=True,
             )
         ],
-        proximity=ProximityContact(
-            x=219.0,
-            y=0.0,
-            angle=-math.pi / 2.0,
-            distance=35.0,
-            normal_x=0.0,
-            normal_y=1.0,
-            terrain_slope=0.0,
-        ),
+        proximity=_ground_below(219.0, distance=35.0),
     )
 
-    sensors = _BotActiveSensors(hill_x=1000.0, hill_width=10.0, hill_height=1.0)
-    action = bot.update(1.0 / 60.0, passive, sensors)
+    action = bot.update(_FRAME_DT, passive, _NO_HILL_SENSORS)
 
     assert "STG:final_descent" in action.status
     assert math.isclose(action.target_angle, 0.0, abs_tol=1e-6)
 
 
 def test_turtle_bot_enters_recovery_stage_after_overshoot_flip() -> None:
-    bot = TurtleBot()
-    bot.set_vehicle_info(
-        VehicleInfo(
-            width=8.0,
-            height=8.0,
-            dry_mass=1.0,
-            fuel_density=0.01,
-            max_thrust_power=50.0,
-            safe_landing_velocity=10.0,
-            safe_landing_angle=math.radians(15.0),
-            radar_outer_range=5000.0,
-            radar_inner_range=2000.0,
-            proximity_sensor_range=500.0,
-        )
-    )
-    sensors = _BotActiveSensors(hill_x=1000.0, hill_width=10.0, hill_height=1.0)
+    bot = _turtle_bot()
+    sensors = _NO_HILL_SENSORS
 
-    first_passive = PassiveSensors(
+    first_passive = _passive(
         x=0.0,
         y=40.0,
         altitude=36.0,
-        terrain_y=0.0,
-        terrain_slope=0.0,
         vx=8.0,
-        vy_up=0.0,
-        angle=0.0,
-        ax=0.0,
-        ay_up=0.0,
-        mass=2.0,
-        thrust_level=0.0,
-        fuel=100.0,
-        state="flying",
         radar_contacts=[
-            RadarContact(
-                uid="recover_site",
-                x=50.0,
-                y=30.0,
-                size=80.0,
-                angle=math.atan2(-10.0, 50.0),
-                distance=math.hypot(50.0, -10.0),
-                rel_x=50.0,
-                rel_y=-10.0,
-                is_inner_lock=True,
-                info={"award": 250.0},
-            )
+            _contact("recover_site", x=50.0, y=30.0, rel_x=50.0, rel_y=-10.0, size=80.0, inner=True)
         ],
-        proximity=ProximityContact(
-            x=0.0,
-            y=0.0,
-            angle=-math.pi / 2.0,
-            distance=40.0,
-            normal_x=0.0,
-            normal_y=1.0,
-            terrain_slope=0.0,
-        ),
+        proximity=_ground_below(0.0, distance=40.0),
     )
-    _ = bot.update(1.0 / 60.0, first_passive, sensors)
+    _ = bot.update(_FRAME_DT, first_passive, sensors)
 
-    second_passive = PassiveSensors(
+    second_passive = _passive(
         x=60.0,
         y=50.0,
         altitude=46.0,
-        terrain_y=0.0,
-        terrain_slope=0.0,
         vx=8.0,
-        vy_up=0.0,
-        angle=0.0,
-        ax=0.0,
-        ay_up=0.0,
-        mass=2.0,
-        thrust_level=0.0,
-        fuel=100.0,
-        state="flying",
         radar_contacts=[
-            RadarContact(
-                uid="recover_site",
+            _contact(
+                "recover_site",
                 x=50.0,
                 y=30.0,
-                size=80.0,
-                angle=math.atan2(-10.0, -10.0),
-                distance=math.hypot(-10.0, -10.0),
                 rel_x=-10.0,
                 rel_y=-10.0,
-                is_inner_lock=True,
-                info={"award": 250.0},
+                size=80.0,
+                inner=True,
             )
         ],
-        proximity=ProximityContact(
-            x=60.0,
-            y=0.0,
-            angle=-math.pi / 2.0,
-            distance=50.0,
-            normal_x=0.0,
-            normal_y=1.0,
-            terrain_slope=0.0,
-        ),
+        proximity=_ground_below(60.0, distance=50.0),
     )
-    action = bot.update(1.0 / 60.0, second_passive, sensors)
+    action = bot.update(_FRAME_DT, second_passive, sensors)
 
     assert "STG:recovery" in action.status
 
 
 def test_landing_site_motion_and_projection_update_model() -> None:
-    world = World()
-    site = Entity(uid="site_a")
-    site.add_component(Transform(pos=Vector2(0.0, 0.0)))
-    site.add_component(LandingSite(size=30.0, terrain_mode="elevated_supports", terrain_bound=False))
-    site.add_component(LandingSiteEconomy(award=200.0, fuel_price=9.0))
-    site.add_component(KinematicMotion(velocity=Vector2(3.0, 0.0)))
-    world.add_entity(site)
+    world = _world(
+        _entity(
+            Transform(pos=Vector2(0.0, 0.0)),
+            LandingSite(size=30.0, terrain_mode="elevated_supports", terrain_bound=False),
+            LandingSiteEconomy(award=200.0, fuel_price=9.0),
+            KinematicMotion(velocity=Vector2(3.0, 0.0)),
+            uid="site_a",
+        )
+    )
 
     model = LandingSiteSurfaceModel()
     motion = LandingSiteMotionSystem()
@@ -1191,33 +833,33 @@ def test_landing_site_motion_and_projection_update_model() -> None:
 
 
 def test_contact_system_lands_using_relative_site_velocity() -> None:
-    world = World()
-
-    lander = Entity(uid="lander")
-    lander.add_component(LanderState(state="flying"))
-    lander.add_component(PhysicsState(vel=Vector2(8.0, -1.0)))
-    lander.add_component(Transform(pos=Vector2(0.0, 4.0), rotation=0.0))
-    lander.add_component(FuelTank())
-    lander.add_component(LanderGeometry(width=8.0, height=8.0))
-    lander.add_component(Wallet(credits=0.0))
-    lander.add_component(Engine())
-    world.add_entity(lander)
-
-    site = Entity(uid="site_landing")
-    site.add_component(Transform(pos=Vector2(0.0, 0.0)))
-    site.add_component(LandingSite(size=30.0, terrain_mode="elevated_supports", terrain_bound=False))
-    site.add_component(LandingSiteEconomy(award=150.0, fuel_price=10.0))
-    site.add_component(KinematicMotion(velocity=Vector2(7.0, 0.0)))
-    world.add_entity(site)
+    lander = _entity(
+        LanderState(state="flying"),
+        PhysicsState(vel=Vector2(8.0, -1.0)),
+        Transform(pos=Vector2(0.0, 4.0), rotation=0.0),
+        FuelTank(),
+        LanderGeometry(width=8.0, height=8.0),
+        Wallet(credits=0.0),
+        Engine(),
+        uid="lander",
+    )
+    site = _entity(
+        Transform(pos=Vector2(0.0, 0.0)),
+        LandingSite(size=30.0, terrain_mode="elevated_supports", terrain_bound=False),
+        LandingSiteEconomy(award=150.0, fuel_price=10.0),
+        KinematicMotion(velocity=Vector2(7.0, 0.0)),
+        uid="site_landing",
+    )
+    world = _world(lander, site)
 
     model = LandingSiteSurfaceModel()
     projection = LandingSiteProjectionSystem(model)
     projection.world = world
-    projection.update(1.0 / 60.0)
+    projection.update(_FRAME_DT)
 
     system = ContactSystem(_FakeContactAdapter(), model)
     system.world = world
-    system.update(1.0 / 60.0)
+    system.update(_FRAME_DT)
 
     ls = lander.get_component(LanderState)
     wallet = lander.get_component(Wallet)
@@ -1228,34 +870,32 @@ def test_contact_system_lands_using_relative_site_velocity() -> None:
 
 
 def test_contact_system_marks_zero_award_site_visited() -> None:
-    world = World()
-
-    lander = Entity(uid="lander")
-    lander.add_component(LanderState(state="flying"))
-    lander.add_component(PhysicsState(vel=Vector2(0.0, -1.0)))
-    lander.add_component(Transform(pos=Vector2(0.0, 4.0), rotation=0.0))
-    lander.add_component(FuelTank())
-    lander.add_component(LanderGeometry(width=8.0, height=8.0))
-    lander.add_component(Wallet(credits=42.0))
-    lander.add_component(Engine())
-    world.add_entity(lander)
-
-    site = Entity(uid="site_zero_award")
-    site.add_component(Transform(pos=Vector2(0.0, 0.0)))
-    site.add_component(
-        LandingSite(size=30.0, terrain_mode="elevated_supports", terrain_bound=False)
+    lander = _entity(
+        LanderState(state="flying"),
+        PhysicsState(vel=Vector2(0.0, -1.0)),
+        Transform(pos=Vector2(0.0, 4.0), rotation=0.0),
+        FuelTank(),
+        LanderGeometry(width=8.0, height=8.0),
+        Wallet(credits=42.0),
+        Engine(),
+        uid="lander",
+    )
+    site = _entity(
+        Transform(pos=Vector2(0.0, 0.0)),
+        LandingSite(size=30.0, terrain_mode="elevated_supports", terrain_bound=False),
+        LandingSiteEconomy(award=0.0, fuel_price=10.0),
+        uid="site_zero_award",
     )
-    site.add_component(LandingSiteEconomy(award=0.0, fuel_price=10.0))
-    world.add_entity(site)
+    world = _world(lander, site)
 
     model = LandingSiteSurfaceModel()
     projection = LandingSiteProjectionSystem(model)
     projection.world = world
-    projection.update(1.0 / 60.0)
+    projection.update(_FRAME_DT)
 
     system = ContactSystem(_FakeContactAdapter(), model)
     system.world = world
-    system.update(1.0 / 60.0)
+    system.update(_FRAME_DT)
 
     ls = lander.get_component(LanderState)
     wallet = lander.get_component(Wallet)
@@ -1269,33 +909,33 @@ def test_contact_system_marks_zero_award_site_visited() -> None:
 
 
 def test_contact_system_does_not_snap_land_when_far_below_site() -> None:
-    world = World()
-
-    lander = Entity(uid="lander")
-    lander.add_component(LanderState(state="flying"))
-    lander.add_component(PhysicsState(vel=Vector2(0.0, -1.0)))
-    # Lander is near in x, but far below pad y.
-    lander.add_component(Transform(pos=Vector2(0.0, 20.0), rotation=0.0))
-    lander.add_component(FuelTank())
-    lander.add_component(LanderGeometry(width=8.0, height=8.0))
-    lander.add_component(Wallet(credits=0.0))
-    lander.add_component(Engine())
-    world.add_entity(lander)
-
-    site = Entity(uid="site_high")
-    site.add_component(Transform(pos=Vector2(0.0, 120.0)))
-    site.add_component(LandingSite(size=30.0, terrain_mode="elevated_supports", terrain_bound=False))
-    site.add_component(LandingSiteEconomy(award=100.0, fuel_price=10.0))
-    world.add_entity(site)
+    lander = _entity(
+        LanderState(state="flying"),
+        PhysicsState(vel=Vector2(0.0, -1.0)),
+        # Lander is near in x, but far below pad y.
+        Transform(pos=Vector2(0.0, 20.0), rotation=0.0),
+        FuelTank(),
+        LanderGeometry(width=8.0, height=8.0),
+        Wallet(credits=0.0),
+        Engine(),
+        uid="lander",
+    )
+    site = _entity(
+        Transform(pos=Vector2(0.0, 120.0)),
+        LandingSite(size=30.0, terrain_mode="elevated_supports", terrain_bound=False),
+        LandingSiteEconomy(award=100.0, fuel_price=10.0),
+        uid="site_high",
+    )
+    world = _world(lander, site)
 
     model = LandingSiteSurfaceModel()
     projection = LandingSiteProjectionSystem(model)
     projection.world = world
-    projection.update(1.0 / 60.0)
+    projection.update(_FRAME_DT)
 
     system = ContactSystem(_FakeCollidingContactAdapter(), model)
     system.world = world
-    system.update(1.0 / 60.0)
+    system.update(_FRAME_DT)
 
     ls = lander.get_component(LanderState)
     assert ls is not None
@@ -1303,26 +943,26 @@ def test_contact_system_does_not_snap_land_when_far_below_site() -> None:
 
 
 def test_contact_system_crashes_on_high_speed_site_plane_cross_without_contact() -> None:
-    world = World()
-
-    lander = Entity(uid="lander")
-    lander.add_component(LanderState(state="flying"))
-    # Unsafe downward speed; current pose is already below the site plane.
-    lander.add_component(PhysicsState(vel=Vector2(0.0, -80.0)))
-    lander.add_component(Transform(pos=Vector2(0.0, -2.0), rotation=0.0))
-    lander.add_component(FuelTank())
-    lander.add_component(LanderGeometry(width=8.0, height=8.0))
-    lander.add_component(Wallet(credits=0.0))
-    lander.add_component(Engine())
-    world.add_entity(lander)
-
-    site = Entity(uid="site_plane")
-    site.add_component(Transform(pos=Vector2(0.0, 0.0)))
-    site.add_component(
-        LandingSite(size=40.0, terrain_mode="elevated_supports", terrain_bound=False)
+    lander = _entity(
+        LanderState(state="flying"),
+        # Unsafe downward speed; current pose is already below the site plane.
+        PhysicsState(vel=Vector2(0.0, -80.0)),
+        Transform(pos=Vector2(0.0, -2.0), rotation=0.0),
+        FuelTank(),
+        LanderGeometry(width=8.0, height=8.0),
+        Wallet(credits=0.0),
+        Engine(),
+        uid="lander",
+    )
+    world = _world(
+        lander,
+        _entity(
+            Transform(pos=Vector2(0.0, 0.0)),
+            LandingSite(size=40.0, terrain_mode="elevated_supports", terrain_bound=False),
+            LandingSiteEconomy(award=100.0, fuel_price=10.0),
+            uid="site_plane",
+        ),
     )
-    site.add_component(LandingSiteEconomy(award=100.0, fuel_price=10.0))
-    world.add_entity(site)
 
     model = LandingSiteSurfaceModel()
     projection = LandingSiteProjectionSystem(model)
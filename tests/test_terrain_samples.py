@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from fakes import FlatTerrain
+
+from core.landing_sites import (
+    LandingSiteSurfaceModel,
+    LandingSiteTerrainModifier,
+    LandingSiteView,
+)
+from core.maths import Range1D, Rect, Vector2
+from core.terrain import AddHeightModifier
+from ui.minimap import Minimap
+from ui.terrain_samples import TerrainSampleWindow
+
+
+class _CountingTerrain:
+    def __init__(self, height_func):
+        self.height_func = height_func
+        self.calls = 0
+
+    def __call__(self, x: float, lod: int = 0) -> float:
+        self.calls += 1
+        return self.height_func(x, lod=lod)
+
+
+def _flush_site(x: float, y: float) -> LandingSiteView:
+    return LandingSiteView(
+        uid="flush",
+        x=x,
+        y=y,
+        size=40.0,
+        vel=Vector2(0.0, 0.0),
+        award=0.0,
+        fuel_price=0.0,
+        terrain_mode="flush_flatten",
+        terrain_bound=True,
+        blend_margin=10.0,
+        cut_depth=0.0,
+        support_height=0.0,
+        visited=False,
+    )
+
+
+def test_terrain_samples_reuse_cells_until_a_site_reshapes_them() -> None:
+    sites = LandingSiteSurfaceModel()
+    terrain = _CountingTerrain(
+        AddHeightModifier(FlatTerrain(), LandingSiteTerrainModifier(sites))
+    )
+    window = TerrainSampleWindow()
+    visible = Rect.from_bounds(0.0, 200.0, -50.0, 50.0)
+
+    first = window.samples(terrain, sites, visible, 0, 10.0)
+    calls = terrain.calls
+    assert window.samples(terrain, sites, visible, 0, 10.0) == first
+    assert terrain.calls == calls
+
+    # A flush site spawning in view flattens the terrain under it.
+    sites.update_from_views([_flush_site(100.0, 25.0)])
+    reshaped = dict(window.samples(terrain, sites, visible, 0, 10.0))
+
+    assert reshaped[100.0] == 25.0
+    assert reshaped[0.0] == 0.0
+    assert terrain.calls - calls < len(first)
+
+    # Moving the site re-samples both its old and new footprint.
+    sites.update_from_views([_flush_site(150.0, 25.0)])
+    moved = dict(window.samples(terrain, sites, visible, 0, 10.0))
+
+    assert moved[100.0] == 0.0
+    assert moved[150.0] == 25.0
+
+
+def test_minimap_samples_refresh_when_a_site_spawns() -> None:
+    sites = LandingSiteSurfaceModel()
+    minimap = Minimap(800, 600, AddHeightModifier(FlatTerrain(), LandingSiteTerrainModifier(sites)))
+    visible = Rect.from_bounds(0.0, 200.0, -50.0, 50.0)
+    span = Range1D(visible.min_x, visible.max_x)
+
+    def _heights() -> dict[float, float]:
+        pts = minimap._sample_terrain(visible, 0, 10.0, 0.0, 210.0, sites.get_sites(span))
+        return {float(x): float(y) for x, y in pts}
+
+    assert _heights()[100.0] == 0.0
+
+    sites.update_from_views([_flush_site(100.0, 25.0)])
+
+    assert _heights()[100.0] == 25.0
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from ui.text_cache import CachedFont
+
+
+class _CountingFont:
+    def __init__(self):
+        self.calls = 0
+
+    def render(self, text, antialias, color, background=None):
+        self.calls += 1
+        return (text, antialias, color, background, self.calls)
+
+    def get_linesize(self) -> int:
+        return 17
+
+
+def test_cached_font_reuses_surfaces_and_evicts_lru() -> None:
+    font = _CountingFont()
+    cached = CachedFont(font, maxsize=2)
+
+    first = cached.render("FUEL: 10%", True, (255, 255, 255))
+    assert cached.render("FUEL: 10%", True, [255, 255, 255]) is first
+    assert font.calls == 1
+
+    cached.render("FUEL: 10%", True, (0, 0, 0))
+    cached.render("FUEL: 10%", True, (255, 255, 255))  # refresh: (0, 0, 0) is now LRU
+    cached.render("SPEED: 3", True, (255, 255, 255))
+    assert font.calls == 3
+
+    cached.render("FUEL: 10%", True, (0, 0, 0))
+    assert font.calls == 4
+    assert cached.get_linesize() == 17
@@ -1,5 +1,8 @@
 """Camera system for moveable and zoomable viewport."""
 
+import numpy as np
+import numpy.typing as npt
+
 from core.maths import Rect, Vector2
 from core.components import Transform
 
@@ -51,6 +54,38 @@ class Camera:
         screen_y = (self.y - pos.y) * self.zoom + self.screen_height / 2
         return Vector2(screen_x, screen_y)
 
+    def affine(self) -> tuple[float, float, float]:
+        """Return ``(scale, tx, ty)`` with ``sx = wx * scale + tx`` and ``sy = ty - wy * scale``.
+
+        Lets hot draw loops hoist the camera state into locals once per frame.
+        """
+        scale = self.zoom
+        return (
+            scale,
+            self.screen_width / 2 - self.x * scale,
+            self.screen_height / 2 + self.y * scale,
+        )
+
+    def world_to_screen_batch(
+        self, xs: npt.ArrayLike, ys: npt.ArrayLike
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorized world_to_screen for coordinate arrays."""
+        sx = (np.asarray(xs, dtype=float) - self.x) * self.zoom + self.screen_width / 2
+        sy = (self.y - np.asarray(ys, dtype=float)) * self.zoom + self.screen_height / 2
+        return sx, sy
+
+    def world_to_screen_inplace(self, pts: np.ndarray) -> np.ndarray:
+        """Map an (N, 2) float array of world points to screen coordinates in place."""
+        xs = pts[:, 0]
+        ys = pts[:, 1]
+        xs -= self.x
+        xs *= self.zoom
+        xs += self.screen_width / 2
+        np.subtract(self.y, ys, out=ys)
+        ys *= self.zoom
+        ys += self.screen_height / 2
+        return pts
+
     def screen_to_world(self, pos: Vector2) -> Vector2:
         """Convert screen pixel coordinates to world coordinates."""
         world_x = (pos.x - self.screen_width / 2) / self.zoom + self.x
@@ -140,6 +175,17 @@ class OffsetCamera:
         pixel_center_x: float,
         pixel_center_y: float,
     ):
+        self.set_view(center_x, center_y, pixels_per_world, pixel_center_x, pixel_center_y)
+
+    def set_view(
+        self,
+        center_x: float,
+        center_y: float,
+        pixels_per_world: float,
+        pixel_center_x: float,
+        pixel_center_y: float,
+    ) -> None:
+        """Re-point this camera in place (same arguments as the constructor)."""
         self.x = center_x
         self.y = center_y
         self.zoom = pixels_per_world
@@ -151,3 +197,11 @@ class OffsetCamera:
         # Invert Y for sub-viewports as well
         sy = int(self._py + (self.y - pos.y) * self.zoom)
         return Vector2(sx, sy)
+
+    def world_to_screen_batch(
+        self, xs: npt.ArrayLike, ys: npt.ArrayLike
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorized world_to_screen for coordinate arrays (same int truncation)."""
+        sx = np.trunc(self._px + (np.asarray(xs, dtype=float) - self.x) * self.zoom)
+        sy = np.trunc(self._py + (self.y - np.asarray(ys, dtype=float)) * self.zoom)
+        return sx, sy
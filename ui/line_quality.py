@@ -0,0 +1,48 @@
+"""Adaptive line quality: drop anti-aliasing while the frame rate is struggling."""
+
+from __future__ import annotations
+
+
+class LineQualityController:
+    """Toggles anti-aliased line drawing from the measured frame rate, with hysteresis.
+
+    Usage per frame:
+        antialias = controller.update(clock.get_fps())
+    """
+
+    def __init__(
+        self,
+        low_fps: float = 45.0,
+        high_fps: float = 58.0,
+        low_frames: int = 10,
+    ):
+        self.low_fps = low_fps
+        self.high_fps = high_fps
+        self.low_frames = low_frames
+        self.antialias = True
+        self._slow_frames = 0
+
+    def reset(self):
+        self.antialias = True
+        self._slow_frames = 0
+
+    def update(self, fps: float) -> bool:
+        """Feed the current FPS estimate and return whether lines should be anti-aliased.
+
+        AA is switched off after ``low_frames`` consecutive frames below ``low_fps``
+        and back on once the rate recovers above ``high_fps``. A non-positive FPS
+        (pygame's clock before it has enough samples) leaves the state unchanged.
+        """
+        if fps <= 0.0:
+            return self.antialias
+        if self.antialias:
+            if fps < self.low_fps:
+                self._slow_frames += 1
+                if self._slow_frames >= self.low_frames:
+                    self.antialias = False
+                    self._slow_frames = 0
+            else:
+                self._slow_frames = 0
+        elif fps > self.high_fps:
+            self.antialias = True
+        return self.antialias
@@ -1,8 +1,13 @@
 """Minimap display showing camera position and terrain overview."""
 
+import math
+
+import numpy as np
+import numpy.typing as npt
 import pygame
-from core.maths import Range1D, Rect, Size2, Vector2
+from core.maths import Range1D, Rect, Size2
 from .camera import Camera, OffsetCamera
+from .terrain_samples import terrain_site_shapes
 
 
 class Minimap:
@@ -46,6 +51,16 @@ class Minimap:
         # Horizontal span in world units
         self.world_span_x = 20000.0
 
+        # Grid-anchored terrain profile reused across frames (see _sample_terrain)
+        self._terrain_samples = np.empty((0, 2))
+        self._terrain_samples_key: tuple | None = None
+
+        # Rendered minimap reused while its inputs are unchanged (see draw). The
+        # padding keeps edge markers/lines that spill past the rect.
+        self._surface_pad = 2
+        self._surface: pygame.Surface | None = None
+        self._state_key: tuple | None = None
+
     def _terrain_resolution(self, lod: int) -> float:
         get_resolution = getattr(self.terrain, "get_resolution", None)
         if callable(get_resolution):
@@ -57,18 +72,85 @@ class Minimap:
 
     def _pick_lod_for_world_step(self, world_step: float, max_lod: int = 8) -> int:
         target = max(1e-6, float(world_step))
-        import math as _math
-
         best_lod = 0
         best_score = float("inf")
         for lod in range(max(0, int(max_lod)) + 1):
             res = self._terrain_resolution(lod)
-            score = abs(_math.log2(res / target))
+            score = abs(math.log2(res / target))
             if score < best_score:
                 best_lod = lod
                 best_score = score
         return best_lod
 
+    def _sample_terrain(
+        self,
+        visible: Rect,
+        lod: int,
+        world_step: float,
+        start_world_x: float,
+        end_world_x: float,
+        site_views=None,
+    ) -> np.ndarray:
+        """Return world-space (x, y) terrain samples for the minimap as an (N, 2) array.
+
+        Samples sit on a world grid anchored to ``world_step``, so they only change
+        when the visible span crosses a grid line, the LOD/step changes, or a
+        terrain-shaping site in ``site_views`` appears, moves or disappears; the
+        last profile is reused until then.
+        """
+        key = (
+            lod,
+            world_step,
+            math.floor(visible.min_x / world_step),
+            math.floor(visible.max_x / world_step),
+            math.ceil(visible.max_x / world_step),
+            terrain_site_shapes(site_views),
+        )
+        if key == self._terrain_samples_key:
+            return self._terrain_samples
+
+        profile_fn = getattr(self.terrain, "profile", None)
+        if callable(profile_fn):
+            samples = profile_fn(
+                visible.min_x,
+                visible.max_x + world_step,
+                lod=lod,
+                step=world_step,
+            )
+        else:
+            count = int((end_world_x - start_world_x) // world_step) + 1
+            samples = []
+            for i in range(count):
+                wx = start_world_x + i * world_step
+                samples.append((wx, self.terrain(wx, lod=lod)))
+
+        self._terrain_samples = np.asarray(samples, dtype=float).reshape(-1, 2)
+        self._terrain_samples_key = key
+        return self._terrain_samples
+
+    @staticmethod
+    def _project_clamped(
+        oc: OffsetCamera, rect: Rect, xs: npt.ArrayLike, ys: npt.ArrayLike
+    ) -> list[list[float]]:
+        """Project world points to minimap pixels and clamp them to ``rect``.
+
+        Array equivalent of ``rect.clamp_point(oc.world_to_screen(...))`` per point.
+        """
+        sx, sy = oc.world_to_screen_batch(xs, ys)
+        np.clip(sx, rect.min_x, rect.max_x, out=sx)
+        np.clip(sy, rect.min_y, rect.max_y, out=sy)
+        return np.column_stack((sx, sy)).tolist()
+
+    def _marker_key(self, site_views, contacts) -> tuple:
+        if site_views is not None:
+            return tuple(
+                (s.x, s.y, (getattr(s, "info", None) or {}).get("award", 1))
+                for s in site_views
+            )
+        return tuple(
+            (c.x, c.y, 1 if not c.info else c.info.get("award", 1)) for c in contacts or ()
+        )
+
     def draw(
         self,
         screen: pygame.Surface,
@@ -79,15 +161,67 @@ class Minimap:
     ):
         """Draw minimap showing terrain overview and viewport indicator.
 
+        The minimap is rendered into a cached surface that is re-blitted as-is while
+        the main camera, height scale, and markers are unchanged.
+
         Args:
             screen: Pygame surface to draw on
             main_camera: Main camera (to show viewport indicator)
             height_scale: Vertical scale for terrain height
         """
+        # Nothing visible to draw: degenerate size (e.g. mid-resize), off-screen,
+        # or a camera zoom that cannot map the viewport.
+        if self.rect.width < 4 or self.rect.height < 4 or main_camera.zoom <= 0:
+            return
+        if not screen.get_rect().colliderect(self.rect.to_pygame_rect()):
+            return
+
+        site_views = None
+        if sites is not None and hasattr(sites, "get_sites"):
+            span = Range1D.from_center(main_camera.x, self.world_span_x / 2.0)
+            site_views = sites.get_sites(span)
+
+        state_key = (
+            main_camera.x,
+            main_camera.y,
+            main_camera.zoom,
+            height_scale,
+            self._marker_key(site_views, contacts),
+        )
+        pad = self._surface_pad
+        if self._surface is None or state_key != self._state_key:
+            if self._surface is None:
+                self._surface = pygame.Surface(
+                    (int(self.rect.width) + 2 * pad, int(self.rect.height) + 2 * pad),
+                    pygame.SRCALPHA,
+                )
+            self._surface.fill((0, 0, 0, 0))
+            local_rect = Rect(x=pad, y=pad, w=self.rect.width, h=self.rect.height)
+            self._render(
+                self._surface,
+                local_rect,
+                main_camera,
+                height_scale,
+                contacts,
+                site_views,
+            )
+            self._state_key = state_key
+        screen.blit(self._surface, (int(self.rect.x) - pad, int(self.rect.y) - pad))
+
+    def _render(
+        self,
+        surface: pygame.Surface,
+        rect: Rect,
+        main_camera: Camera,
+        height_scale: float,
+        contacts,
+        site_views,
+    ) -> None:
+        """Draw the minimap contents into ``surface`` with the minimap placed at ``rect``."""
         # Draw background and border
-        minimap_rect = self.rect.to_pygame_rect()
-        pygame.draw.rect(screen, self.bg_color, minimap_rect)
-        pygame.draw.rect(screen, self.border_color, minimap_rect, 2)
+        minimap_rect = rect.to_pygame_rect()
+        pygame.draw.rect(surface, self.bg_color, minimap_rect)
+        pygame.draw.rect(surface, self.border_color, minimap_rect, 2)
 
         # Get main camera viewport bounds (used later for viewport box only)
         visible = main_camera.get_visible_world_rect()
@@ -119,95 +253,75 @@ class Minimap:
         desired_step = world_span / 80.0
         lod = self._pick_lod_for_world_step(desired_step)
         world_step = max(desired_step, self._terrain_resolution(lod))
-        import math as _math
-
-        start_world_x = _math.floor(minimap_visible.min_x / world_step) * world_step
+        start_world_x = (minimap_visible.min_x // world_step) * world_step
         end_world_x = minimap_visible.max_x + world_step
 
         minimap_points = []
 
-        # Build an offset camera that maps directly to absolute screen pixels
+        # Build an offset camera that maps directly to target-surface pixels
         oc = OffsetCamera(
             self.camera.x,
             self.camera.y,
             self.camera.zoom,
-            self.rect.x + self.rect.width / 2.0,
-            self.rect.y + self.rect.height / 2.0,
+            rect.x + rect.width / 2.0,
+            rect.y + rect.height / 2.0,
         )
 
-        profile_fn = getattr(self.terrain, "profile", None)
-        if callable(profile_fn):
-            samples = profile_fn(
-                minimap_visible.min_x,
-                minimap_visible.max_x + world_step,
-                lod=lod,
-                step=world_step,
+        pts = self._sample_terrain(
+            minimap_visible, lod, world_step, start_world_x, end_world_x, site_views
+        )
+        if len(pts):
+            minimap_points = self._project_clamped(
+                oc, rect, pts[:, 0], pts[:, 1] * height_scale
             )
-        else:
-            samples = []
-            wx = start_world_x
-            while wx <= end_world_x:
-                samples.append((wx, self.terrain(wx, lod=lod)))
-                wx += world_step
-
-        for wx, wy in samples:
-            minimap_pt = oc.world_to_screen(Vector2(wx, wy * height_scale))
-            minimap_pt = self.rect.clamp_point(minimap_pt)
-            minimap_points.append((minimap_pt.x, minimap_pt.y))
 
         # Draw terrain
         if len(minimap_points) >= 2:
-            pygame.draw.aalines(screen, self.terrain_color, False, minimap_points)
+            pygame.draw.aalines(surface, self.terrain_color, False, minimap_points)
 
         # Draw viewport indicator using minimap camera
         # Convert main camera bounds to minimap screen coordinates
-        viewport_corners = [
-            (cam_min_x, cam_min_y),
-            (cam_max_x, cam_min_y),
-            (cam_max_x, cam_max_y),
-            (cam_min_x, cam_max_y),
-        ]
-
-        minimap_viewport_corners = []
-        for world_x, world_y in viewport_corners:
-            minimap_pt = oc.world_to_screen(Vector2(world_x, world_y))
-            minimap_pt = self.rect.clamp_point(minimap_pt)
-            minimap_viewport_corners.append((minimap_pt.x, minimap_pt.y))
+        minimap_viewport_corners = self._project_clamped(
+            oc,
+            rect,
+            (cam_min_x, cam_max_x, cam_max_x, cam_min_x),
+            (cam_min_y, cam_min_y, cam_max_y, cam_max_y),
+        )
 
         # Draw viewport rectangle
-        if len(minimap_viewport_corners) == 4:
-            pygame.draw.lines(
-                screen, self.viewport_color, True, minimap_viewport_corners, 2
-            )
+        pygame.draw.lines(surface, self.viewport_color, True, minimap_viewport_corners, 2)
 
         # Draw landing-site markers.
-        if sites is not None and hasattr(sites, "get_sites"):
-            span = Range1D.from_center(self.camera.x, self.world_span_x / 2.0)
-            for s in sites.get_sites(span):
-                world_y = s.y * height_scale
-                pt = oc.world_to_screen(Vector2(s.x, world_y))
-                pt = self.rect.clamp_point(pt)
-                info = getattr(s, "info", None) or {}
-                color = (255, 255, 0) if info.get("award", 1) == 0 else (50, 255, 50)
-                pygame.draw.rect(
-                    screen,
-                    color,
-                    pygame.Rect(int(pt.x) - 2, int(pt.y) - 2, 4, 4),
-                )
+        if site_views is not None:
+            markers = [
+                (s.x, s.y, (getattr(s, "info", None) or {}).get("award", 1))
+                for s in site_views
+            ]
+            self._draw_markers(surface, rect, oc, markers, height_scale)
             return
 
         # Fallback: radar contacts (older call sites)
         if contacts:
-            for c in contacts:
-                if c.x is None or c.y is None:
-                    continue
-                world_y = c.y * height_scale
-                pt = oc.world_to_screen(Vector2(c.x, world_y))
-                pt = self.rect.clamp_point(pt)
-                award = 1 if not c.info else c.info.get("award", 1)
-                color = (255, 255, 0) if award == 0 else (50, 255, 50)
-                pygame.draw.rect(
-                    screen,
-                    color,
-                    pygame.Rect(int(pt.x) - 2, int(pt.y) - 2, 4, 4),
-                )
+            markers = [
+                (c.x, c.y, 1 if not c.info else c.info.get("award", 1))
+                for c in contacts
+                if c.x is not None and c.y is not None
+            ]
+            self._draw_markers(surface, rect, oc, markers, height_scale)
+
+    def _draw_markers(
+        self,
+        surface: pygame.Surface,
+        rect: Rect,
+        oc: OffsetCamera,
+        markers: list[tuple[float, float, float]],
+        height_scale: float,
+    ) -> None:
+        """Draw 4px site markers from (world_x, world_y, award) tuples."""
+        if not markers:
+            return
+        xs, ys, awards = zip(*markers)
+        points = self._project_clamped(oc, rect, xs, np.multiply(ys, height_scale))
+        for (px, py), award in zip(points, awards):
+            color = (255, 255, 0) if award == 0 else (50, 255, 50)
+            surface.fill(color, pygame.Rect(int(px) - 2, int(py) - 2, 4, 4))
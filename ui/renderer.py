@@ -2,16 +2,20 @@
 
 import os
 import random  # noqa: F401 (may be used elsewhere by runtime effects)
+import numpy as np
 import pygame
 from .camera import OffsetCamera, Camera
 from .minimap import Minimap
 from typing import TYPE_CHECKING
 import math
 from .auto_zoom import AutoZoomController
+from .line_quality import LineQualityController
 from .hud import HudOverlay
 from .overlays import SensorOverlay
 from .fps_overlay import FpsOverlay
-from core.maths import Range1D
+from .text_cache import CachedFont
+from .terrain_samples import TerrainSampleWindow
+from core.maths import Range1D, Rect
 from core.components import (
     Engine,
     FuelTank,
@@ -83,6 +87,9 @@ class Renderer:
                 width=geo.width / 2.0,
                 length=20.0,
                 power=eng.thrust_level,
+                # (cos, sin) of world_angle, without the round trip through trig
+                ux=-sin_r,
+                uy=-cos_r,
             )
         ]
 
@@ -104,6 +111,9 @@ class Renderer:
         self.main_camera = Camera(width, height)
         # Auto-zoom controller is owned by the renderer
         self.auto_zoom = AutoZoomController(delay_seconds=3.0, response_rate=1.0)
+        # Anti-aliased terrain/flame lines, dropped while the frame rate is struggling
+        self.line_quality = LineQualityController()
+        self.aa_lines = True
 
         # Colors
         self.bg_color = (20, 20, 25)
@@ -117,10 +127,21 @@ class Renderer:
         self.thrust_flame_length = 20
         self.thrust_flame_color_low = (255, 0, 0)
         self.thrust_flame_color_high = (255, 255, 0)
+        # Flame color gradient by power, quantized to 256 steps
+        low = self.thrust_flame_color_low
+        high = self.thrust_flame_color_high
+        self._flame_lut = [
+            tuple(int(lo * (1 - t) + hi * t) for lo, hi in zip(low, high))
+            for t in (i / 255 for i in range(256))
+        ]
 
         # Terrain rendering settings
         self.height_scale = 1.0  # Vertical scale for terrain height (in world units)
         self.target_segments = 80  # Target number of segments across screen
+        # Scratch buffer for the terrain polyline, reused across frames (grown on demand)
+        self._terrain_pts = np.empty((256, 2))
+        # Terrain heights by world-grid index, kept across frames
+        self._terrain_window = TerrainSampleWindow()
 
         # Create minimap
         self.minimap = Minimap(
@@ -132,22 +153,25 @@ class Renderer:
         # UI fonts
         self.font = pygame.font.SysFont("monospace", 14)
         self.large_font = pygame.font.SysFont("monospace", 32, bold=True)
-        self.hud = HudOverlay(self.font, self.screen, bot=self.bot)
+        # Overlays share one memoized renderer for their (mostly repeating) text
+        self.text_font = CachedFont(self.font)
+        self.hud = HudOverlay(self.text_font, self.screen, bot=self.bot)
 
         self.indicator_circle_size = 0.8
 
         # Orientation inset (center) shown when zoomed far out
         self.orientation_inset_trigger_zoom = 1.0  # show inset when zoom <= this
         self.orientation_inset_scale_px_per_world = 2.0  # fixed zoom for inset
+        self._inset_cam: OffsetCamera | None = None  # reused across frames
         self.sensor_overlay = SensorOverlay(
-            self.font,
+            self.text_font,
             self.screen,
             self.landing_target_color,
             self.visited_landing_target_color,
             self.indicator_circle_size,
             self.height_scale,
         )
-        self.fps_overlay = FpsOverlay(self.font, self.screen, self.clock)
+        self.fps_overlay = FpsOverlay(self.text_font, self.screen, self.clock)
 
     def tick(self, target_fps: int) -> float:
         """Tick internal clock and return frame dt in seconds."""
@@ -200,44 +224,56 @@ class Renderer:
                 best_score = score
         return best_lod
 
-    def draw_terrain(self):
-        """Draw terrain as a polyline sampled on a stable world grid to reduce shimmer."""
-        visible = self.main_camera.get_visible_world_rect()
+    def draw_terrain(self, visible: Rect):
+        """Draw terrain as a polyline sampled on a stable world grid to reduce shimmer.
+
+        ``visible`` is the main camera's world-space view rect for this frame.
+        """
         world_span = visible.width
 
         # Choose a world-step based on target segments and anchor it to a world grid
         if self.target_segments <= 0:
             self.target_segments = 80
-        desired_step = world_span / max(1, self.target_segments)
+        # Keep segments at least ~8px wide: more samples than that add no visible detail
+        # on small windows.
+        segments = min(self.target_segments, self.screen.get_width() // 8)
+        desired_step = world_span / max(1, segments)
         lod = self._pick_lod_for_world_step(desired_step)
         base_interval = self._terrain_resolution(lod)
         world_step = max(desired_step, base_interval)
 
-        profile_fn = getattr(self.level.terrain, "profile", None)
-        if callable(profile_fn):
-            samples = profile_fn(
-                visible.min_x,
-                visible.max_x + world_step,
-                lod=lod,
-                step=world_step,
-            )
-        else:
-            start_world_x = math.floor(visible.min_x / world_step) * world_step
-            end_world_x = visible.max_x + world_step
-            samples = []
-            wx = start_world_x
-            while wx <= end_world_x:
-                samples.append((wx, self.level.terrain(wx, lod=lod)))
-                wx += world_step
-
-        screen_points = [
-            self.main_camera.world_to_screen(Vector2(wx, wy * self.height_scale))
-            for wx, wy in samples
-        ]
+        samples = self._terrain_window.samples(
+            self.level.terrain, self.level.sites, visible, lod, world_step
+        )
+
+        if len(samples) < 2:
+            return
+        n = len(samples)
+        if n > len(self._terrain_pts):
+            self._terrain_pts = np.empty((max(n, 2 * len(self._terrain_pts)), 2))
+        pts = self._terrain_pts[:n]
+        pts[:] = samples
+        heights = pts[:, 1]
+        heights *= self.height_scale
+        # The polyline stays within its samples' y-range: skip it when that range is
+        # entirely above or below the view (e.g. camera high above the terrain).
+        if heights.max() < visible.min_y or heights.min() > visible.max_y:
+            return
+        self.main_camera.world_to_screen_inplace(pts)
+        # Samples are sorted by x: keep the on-screen run plus one point past each edge
+        # so the polyline still reaches the screen border.
+        px = pts[:, 0]
+        i0 = max(0, int(np.searchsorted(px, 0.0, side="right")) - 1)
+        i1 = min(n, int(np.searchsorted(px, self.main_camera.screen_width)) + 1)
+        if i1 - i0 < 2:
+            return
+        screen_points = pts[i0:i1].tolist()
 
-        if len(screen_points) >= 2:
-            # Anti-aliased lines to reduce visual shimmer
+        # Anti-aliased lines to reduce visual shimmer (solid lines when under load)
+        if self.aa_lines:
             pygame.draw.aalines(self.screen, self.terrain_color, False, screen_points)
+        else:
+            pygame.draw.lines(self.screen, self.terrain_color, False, screen_points)
 
     def _get_radar_contacts(self):
         lander = self.level.lander
@@ -246,19 +282,23 @@ class Renderer:
         readings = self._require_component(lander, SensorReadings)
         return readings.radar_contacts
 
-    def draw_targets(self, contacts=None):
+    def draw_targets(self, contacts, visible: Rect):
+        # Camera state is constant for the frame; map points with the hoisted affine.
+        scale, tx0, ty0 = self.main_camera.affine()
+        height_scale = self.height_scale
+
         # Prefer canonical site projections for world-accurate visuals.
         sites = getattr(self.level, "sites", None)
         if sites is not None and hasattr(sites, "get_sites"):
-            visible = self.main_camera.get_visible_world_rect()
             center_x = (visible.min_x + visible.max_x) * 0.5
             span = Range1D.from_center(center_x, visible.width * 0.5)
             for s in sites.get_sites(span):
                 tx = s.x
-                ty = s.y * self.height_scale
+                ty = s.y * height_scale
                 half = s.size * 0.5
-                start_pos = self.main_camera.world_to_screen(Vector2(tx - half, ty))
-                end_pos = self.main_camera.world_to_screen(Vector2(tx + half, ty))
+                sy = ty0 - ty * scale
+                start_pos = ((tx - half) * scale + tx0, sy)
+                end_pos = ((tx + half) * scale + tx0, sy)
                 color = (
                     self.visited_landing_target_color
                     if (getattr(s, "visited", False) or getattr(s, "award", 1.0) == 0.0)
@@ -272,23 +312,27 @@ class Renderer:
                 ) == "elevated_supports":
                     support_xs = (tx - half * 0.7, tx + half * 0.7)
                     for sx in support_xs:
-                        ground_y = self.level.terrain(sx) * self.height_scale
-                        top = self.main_camera.world_to_screen(Vector2(sx, ty))
-                        base = self.main_camera.world_to_screen(Vector2(sx, ground_y))
+                        ground_y = self.level.terrain(sx) * height_scale
+                        px = sx * scale + tx0
+                        top = (px, sy)
+                        base = (px, ty0 - ground_y * scale)
                         pygame.draw.line(self.screen, color, top, base, 2)
             return
 
         # Fallback to radar contacts when site model is unavailable.
-        if contacts is None:
-            contacts = self._get_radar_contacts()
+        min_x, max_x = visible.min_x, visible.max_x
         for c in contacts:
             if c.x is None or c.y is None or c.size is None:
                 continue
             tx = c.x
-            ty = c.y * self.height_scale
             half = c.size / 2.0
-            start_pos = self.main_camera.world_to_screen(Vector2(tx - half, ty))
-            end_pos = self.main_camera.world_to_screen(Vector2(tx + half, ty))
+            # Cull pads entirely left/right of the view before projecting them.
+            if tx + half < min_x or tx - half > max_x:
+                continue
+            ty = c.y * height_scale
+            sy = ty0 - ty * scale
+            start_pos = ((tx - half) * scale + tx0, sy)
+            end_pos = ((tx + half) * scale + tx0, sy)
             color = (
                 self.visited_landing_target_color
                 if (getattr(c, "info", None) and c.info.get("award", 1) == 0)
@@ -302,11 +346,8 @@ class Renderer:
             return
         if entity.get_component(LanderGeometry) is None or entity.get_component(Transform) is None:
             return
-        poly_world = self._get_body_polygon(entity)
-        rotated_points = []
-        for world_pt in poly_world:
-            rotated_points.append(camera.world_to_screen(world_pt))
-            
+        to_screen = camera.world_to_screen
+        rotated_points = [to_screen(world_pt) for world_pt in self._get_body_polygon(entity)]
         if rotated_points:
             pygame.draw.polygon(self.screen, (255, 255, 255), rotated_points, 2)
 
@@ -314,21 +355,23 @@ class Renderer:
         """Draw inverted V shaped thrust flames given thrust descriptors.
 
         Each thrust provides base center (x,y), direction angle, base width, and
-        length. We draw two lines from the tip back to the base corners.
+        length. Each flame is one open polyline: base corner -> tip -> base corner.
         """
         if not thrusts:
             return
 
+        rand = random.random
+        flame_lut = self._flame_lut
         for t in thrusts:
-            # Compute tip point in world using angle (0 along +x, CCW, y-up)
-            ux = math.cos(t.angle)
-            uy = math.sin(t.angle)
+            # Flame direction (unit vector of angle: 0 along +x, CCW, y-up)
+            ux = t.ux
+            uy = t.uy
 
             width = t.width / 2.0 + t.power * (t.width / 2.0)
-            width *= 0.9 + 0.2 * random.random()
+            width *= 0.9 + 0.2 * rand()
 
             length = t.length * t.power
-            length *= 0.9 + 0.2 * random.random()
+            length *= 0.9 + 0.2 * rand()
 
             tip_x = t.x + ux * length
             tip_y = t.y + uy * length
@@ -343,22 +386,18 @@ class Renderer:
             right_y = t.y - py * half_w
 
             # Color gradient based on power
-            p = max(0.0, min(1.0, t.power))
-            low = self.thrust_flame_color_low
-            high = self.thrust_flame_color_high
-            color = (
-                int(low[0] * (1 - p) + high[0] * p),
-                int(low[1] * (1 - p) + high[1] * p),
-                int(low[2] * (1 - p) + high[2] * p),
-            )
+            color = flame_lut[max(0, min(255, int(t.power * 255)))]
 
-            # Transform to screen space and draw two lines
+            # Transform to screen space and draw both flame edges as one open polyline
             tip_pos = camera.world_to_screen(Vector2(tip_x, tip_y))
             left_pos = camera.world_to_screen(Vector2(left_x, left_y))
             right_pos = camera.world_to_screen(Vector2(right_x, right_y))
-            
-            pygame.draw.aaline(self.screen, color, tip_pos, left_pos)
-            pygame.draw.aaline(self.screen, color, tip_pos, right_pos)
+
+            flame = (left_pos, tip_pos, right_pos)
+            if self.aa_lines:
+                pygame.draw.aalines(self.screen, color, False, flame)
+            else:
+                pygame.draw.lines(self.screen, color, False, flame)
 
     def draw_ui(self):
         """Draw UI text: credits and focused-actor flight stats."""
@@ -366,15 +405,20 @@ class Renderer:
 
     def draw(self):
         """Render the complete scene."""
+        self.aa_lines = self.line_quality.update(self.clock.get_fps())
+
         # Clear background
         self.screen.fill(self.bg_color)
 
+        # Main view bounds, computed once and shared by the world-space draws
+        visible = self.main_camera.get_visible_world_rect()
+
         # Draw terrain
-        self.draw_terrain()
+        self.draw_terrain(visible)
 
-        # Draw landing targets
+        # Draw landing targets (radar contacts are read once per frame and shared below)
         contacts = self._get_radar_contacts()
-        self.draw_targets(contacts)
+        self.draw_targets(contacts, visible)
 
         # Draw sensor overlays
         proximity = None
@@ -432,7 +476,7 @@ class Renderer:
 
         # Rectangle same size as minimap, positioned at bottom-right of screen
         mm = self.minimap
-        margin = getattr(mm, "margin", 10)
+        margin = mm.margin
         rect = pygame.Rect(
             int(self.screen.get_width() - mm.rect.width - margin),
             int(self.screen.get_height() - mm.rect.height - margin),
@@ -441,16 +485,18 @@ class Renderer:
         )
 
         # Background and border similar to minimap styling
-        bg_color = getattr(mm, "bg_color", (0, 0, 0))
-        border_color = getattr(mm, "border_color", (200, 200, 200))
-        pygame.draw.rect(self.screen, bg_color, rect)
-        pygame.draw.rect(self.screen, border_color, rect, 2)
+        pygame.draw.rect(self.screen, mm.bg_color, rect)
+        pygame.draw.rect(self.screen, mm.border_color, rect, 2)
 
         cx, cy = rect.center
 
         # Use an OffsetCamera centered on the lander with fixed inset scale
         scale = self.orientation_inset_scale_px_per_world
-        inset_cam = OffsetCamera(trans.pos.x, trans.pos.y, scale, cx, cy)
+        inset_cam = self._inset_cam
+        if inset_cam is None:
+            inset_cam = self._inset_cam = OffsetCamera(trans.pos.x, trans.pos.y, scale, cx, cy)
+        else:
+            inset_cam.set_view(trans.pos.x, trans.pos.y, scale, cx, cy)
 
         # Clip drawing to the interior of the rectangle (minus border)
         prev_clip = self.screen.get_clip()
@@ -0,0 +1,95 @@
+"""Grid-anchored terrain height cache for the main view's terrain polyline."""
+
+from __future__ import annotations
+
+import math
+
+from core.maths import Range1D
+
+
+def terrain_site_shapes(site_views) -> frozenset[tuple]:
+    """Return the parameters of the sites in ``site_views`` that reshape terrain.
+
+    Elevated and free-floating sites are skipped: they leave the ground as is.
+    """
+    if not site_views:
+        return frozenset()
+    return frozenset(
+        (s.x, s.y, s.size, s.blend_margin, s.cut_depth, s.terrain_mode)
+        for s in site_views
+        if s.terrain_bound and s.terrain_mode != "elevated_supports"
+    )
+
+
+class TerrainSampleWindow:
+    """Keeps terrain heights per world-grid index across frames.
+
+    Only cells newly uncovered by panning are sampled. Landing sites reshape the
+    terrain they sit on, so cells under a terrain-shaping site are re-sampled
+    whenever that site appears, moves or disappears.
+
+    Usage per frame:
+        samples = window.samples(terrain, sites, visible, lod, world_step)
+    """
+
+    def __init__(self):
+        self._terrain = None
+        self._grid: tuple[int, float] | None = None
+        self._cells: dict[int, float] = {}
+        self._site_shapes: frozenset[tuple] = frozenset()
+
+    def samples(
+        self, terrain, sites, visible, lod: int, world_step: float
+    ) -> list[tuple[float, float]]:
+        """Return grid-anchored (x, y) terrain samples covering ``visible``."""
+        if terrain is not self._terrain or (lod, world_step) != self._grid:
+            self._terrain = terrain
+            self._grid = (lod, world_step)
+            self._cells = {}
+        first = math.floor(visible.min_x / world_step)
+        last = math.ceil((visible.max_x + world_step) / world_step)
+
+        # Same reach the site terrain modifier uses when looking up nearby sites.
+        margin = 80.0 * (2**lod)
+        self._drop_changed_sites(
+            sites, Range1D(visible.min_x - margin, visible.max_x + margin), lod, world_step
+        )
+
+        window = self._cells
+        missing = [i for i in range(first, last + 1) if i not in window]
+        if missing:
+            profile_fn = getattr(terrain, "profile", None)
+            if callable(profile_fn):
+                fetched = profile_fn(
+                    missing[0] * world_step,
+                    missing[-1] * world_step,
+                    lod=lod,
+                    step=world_step,
+                )
+                for wx, wy in fetched:
+                    window[round(wx / world_step)] = wy
+            else:
+                for i in missing:
+                    window[i] = terrain(i * world_step, lod=lod)
+            # Drop cells that scrolled out of view so the window stays screen-sized.
+            if len(window) > last - first + 1:
+                window = {i: window[i] for i in range(first, last + 1)}
+                self._cells = window
+
+        return [(i * world_step, window[i]) for i in range(first, last + 1)]
+
+    def _drop_changed_sites(self, sites, span: Range1D, lod: int, world_step: float):
+        shapes = terrain_site_shapes(None if sites is None else sites.get_sites(span))
+        if shapes == self._site_shapes:
+            return
+        changed = shapes ^ self._site_shapes
+        self._site_shapes = shapes
+        cells = self._cells
+        if not cells:
+            return
+        for x, _y, size, blend_margin, _cut, _mode in changed:
+            reach = size / 2.0 + max(0.0, blend_margin) * (2**lod)
+            lo = math.floor((x - reach) / world_step)
+            hi = math.ceil((x + reach) / world_step)
+            for i in range(lo, hi + 1):
+                cells.pop(i, None)
@@ -0,0 +1,43 @@
+"""Memoized text rendering shared by the UI overlays."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+
+
+class CachedFont:
+    """Font wrapper whose ``render`` reuses surfaces for repeated (text, color) pairs.
+
+    Most overlay text (labels, control hints, slowly-changing values) repeats frame
+    to frame, so this drops in wherever a ``pygame.font.Font`` is passed to an
+    overlay. Entries are evicted least-recently-used beyond ``maxsize``; other
+    attributes are forwarded to the wrapped font.
+    """
+
+    def __init__(self, font, maxsize: int = 256):
+        self.font = font
+        self.maxsize = maxsize
+        self._cache: OrderedDict[tuple, object] = OrderedDict()
+
+    def render(self, text, antialias, color, background=None):
+        key = (
+            text,
+            bool(antialias),
+            tuple(color),
+            None if background is None else tuple(background),
+        )
+        surface = self._cache.get(key)
+        if surface is not None:
+            self._cache.move_to_end(key)
+            return surface
+        surface = self.font.render(text, antialias, color, background)
+        self._cache[key] = surface
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+        return surface
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def __getattr__(self, name: str):
+        return getattr(self.font, name)